@@ -10,7 +10,8 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
+from pymodbus.exceptions import ModbusException
 
 from .const import (
     CONF_MODBUS_HOST,
@@ -48,26 +49,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         slave_address=slave_address,
     )
 
-    # Test connection to ensure device is accessible
+    # Test connection to ensure device is accessible. Network failures come
+    # back as False and are retried; a bad configuration raises instead, as
+    # retrying would just hammer the device's single client slot.
     try:
-        if not await modbus_client.connect():
-            _LOGGER.error(
-                "Failed to connect to Modbus device at %s:%s",
-                host,
-                port,
-            )
-            raise ConfigEntryNotReady(f"Could not connect to Modbus device at {host}:{port}")
-    except Exception as err:
+        connected = await modbus_client.connect()
+    except (ModbusException, ValueError) as err:
         _LOGGER.error(
-            "Error connecting to Modbus device at %s:%s: %s",
+            "Invalid Modbus configuration for %s:%s (slave %s): %s",
             host,
             port,
+            slave_address,
             err,
         )
-        raise ConfigEntryNotReady(
-            f"Could not connect to Modbus device at {host}:{port}: {err}"
+        raise ConfigEntryError(
+            f"Invalid Modbus configuration for {host}:{port} (slave {slave_address}): {err}"
         ) from err
 
+    if not connected:
+        _LOGGER.error(
+            "Failed to connect to Modbus device at %s:%s",
+            host,
+            port,
+        )
+        raise ConfigEntryNotReady(f"Could not connect to Modbus device at {host}:{port}")
+
     # Create coordinator
     coordinator = BytewattCoordinator(
         hass=hass,
@@ -92,8 +98,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady(f"Failed to set up price monitoring: {err}") from err
 
     # Store coordinator in hass.data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data[entry.entry_id] = coordinator
 
     # Forward setup to all platforms (Medium fix #11 - cleanup on failure)
     try:
@@ -103,8 +109,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Clean up on failure
         await coordinator.async_shutdown()
         await modbus_client.disconnect()
-        hass.data[DOMAIN].pop(entry.entry_id, None)
-        if not hass.data[DOMAIN]:
+        domain_data.pop(entry.entry_id, None)
+        if not domain_data:
             hass.data.pop(DOMAIN, None)
         raise ConfigEntryNotReady(f"Failed to set up platforms: {err}") from err
 
@@ -129,33 +135,35 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if unload_ok:
         # Get coordinator with guard check (High fix #7)
-        if DOMAIN not in hass.data or entry.entry_id not in hass.data[DOMAIN]:
+        domain_data = hass.data.get(DOMAIN)
+        coordinator: BytewattCoordinator | None = (
+            domain_data.get(entry.entry_id) if domain_data else None
+        )
+        if coordinator is None:
             _LOGGER.warning("Coordinator not found in hass.data during unload")
             return unload_ok
 
-        coordinator: BytewattCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-        # Clean up coordinator (stop price monitoring, etc.) with timeout
+        # Stop price monitoring first so nothing is still using the connection,
+        # then always disconnect - even if shutdown timed out - so the socket
+        # isn't leaked. The disconnect isn't cut short by the shutdown budget;
+        # its own requests are already bounded by the client timeout
         try:
             await asyncio.wait_for(coordinator.async_shutdown(), timeout=5.0)
         except TimeoutError:
             _LOGGER.warning("Coordinator shutdown timed out after 5s")
         except Exception as err:
             _LOGGER.error("Error shutting down coordinator: %s", err)
-
-        # Disconnect Modbus client with timeout
-        try:
-            await asyncio.wait_for(coordinator.modbus_client.disconnect(), timeout=5.0)
-        except TimeoutError:
-            _LOGGER.warning("Modbus disconnect timed out after 5s")
-        except Exception as err:
-            _LOGGER.error("Error disconnecting Modbus client: %s", err)
+        finally:
+            try:
+                await coordinator.modbus_client.disconnect()
+            except Exception as err:
+                _LOGGER.error("Error disconnecting Modbus client: %s", err)
 
         # Remove coordinator from hass.data
-        hass.data[DOMAIN].pop(entry.entry_id)
+        domain_data.pop(entry.entry_id)
 
         # Clean up domain data if empty
-        if not hass.data[DOMAIN]:
+        if not domain_data:
             hass.data.pop(DOMAIN)
 
         _LOGGER.info("Bytewatt Export Limiter integration unloaded successfully")
@@ -167,14 +175,7 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry when options change."""
     _LOGGER.debug("Reloading Bytewatt Export Limiter integration")
 
-    # Unload the entry (Medium fix #12 - check return value)
-    unload_ok = await async_unload_entry(hass, entry)
-
-    if not unload_ok:
-        _LOGGER.error("Failed to unload entry during reload, skipping setup")
-        return
-
-    # Reload the entry
-    await async_setup_entry(hass, entry)
-
-    _LOGGER.info("Bytewatt Export Limiter integration reloaded successfully")
+    # Let Home Assistant drive unload + setup: it serialises reloads of the same
+    # entry, so a second options change waits instead of racing the Modbus
+    # disconnect/connect of the first (the device only accepts one client)
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
@@ -54,6 +53,8 @@ class BytewattCurtailedBinarySensor(CoordinatorEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_curtailed"
         self._attr_name = "Export Curtailed"
+        # Shared dict built once by the coordinator
+        self._attr_device_info = coordinator.device_info
 
     @property
     def available(self) -> bool:
@@ -63,13 +64,7 @@ class BytewattCurtailedBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if export is curtailed (limit < their_limit)."""
-        if self.coordinator.data is None:
-            _LOGGER.debug("Coordinator data is None for curtailed sensor")
+        data = self.coordinator.data
+        if data is None:
             return None
-        # High fix #7: Don't use False as default - return None if key missing
-        return self.coordinator.data.get("is_curtailed")
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return self.coordinator.device_info
+        return data.is_curtailed
@@ -14,6 +14,8 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
+from pymodbus.client import AsyncModbusTcpClient
+from pymodbus.exceptions import ModbusException
 
 from .const import (
     CONF_CURTAILED_LIMIT,
@@ -32,9 +34,51 @@ from .const import (
     DOMAIN,
     REG_EXPORT_LIMIT,
 )
+from .modbus_client import AsyncModbusClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Numeric automation fields - range/step are enforced by the frontend number input.
+# NumberSelector yields floats, so integer fields are coerced back to int.
+_PRICE_THRESHOLD_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=-100.0, max=100.0, step=0.01, mode=selector.NumberSelectorMode.BOX
+    )
+)
+_CURTAILED_LIMIT_SELECTOR = vol.All(
+    selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=0,
+            max=50000,
+            step=1,
+            mode=selector.NumberSelectorMode.BOX,
+            unit_of_measurement="W",
+        )
+    ),
+    vol.Coerce(int),
+)
+_POLL_INTERVAL_SELECTOR = vol.All(
+    selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=10,
+            max=300,
+            step=1,
+            mode=selector.NumberSelectorMode.BOX,
+            unit_of_measurement="s",
+        )
+    ),
+    vol.Coerce(int),
+)
+
+
+def _find_existing_client(hass: HomeAssistant, host: str, port: int) -> AsyncModbusClient | None:
+    """Return the Modbus client of a loaded entry connected to the same gateway, if any."""
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        client = coordinator.modbus_client
+        if (client.host, client.port) == (host, port):
+            return client
+    return None
+
 
 async def validate_modbus_connection(
     hass: HomeAssistant, host: str, port: int, slave: int
@@ -54,32 +98,47 @@ async def validate_modbus_connection(
         CannotConnect: If connection fails
         InvalidAuth: If slave address is invalid
     """
-    from pymodbus.client import AsyncModbusTcpClient
+    # The gateway only accepts one TCP client. If a loaded entry already holds
+    # that connection (for another slave on the same host:port), validate
+    # through it instead of opening a second socket
+    existing_client = _find_existing_client(hass, host, port)
+    if existing_client is not None:
+        try:
+            registers = await existing_client.read_device_registers(
+                slave, REG_EXPORT_LIMIT, count=2
+            )
+        except ModbusException as err:
+            raise CannotConnect(f"Failed to read from Modbus device: {err}") from err
+        if registers is None:
+            _LOGGER.error("Failed to read register 0x%04X from slave %s", REG_EXPORT_LIMIT, slave)
+            raise InvalidAuth(f"Slave address {slave} not responding or invalid")
+        _LOGGER.info(
+            "Validated Modbus connection to %s:%s (slave %s) using existing client",
+            host,
+            port,
+            slave,
+        )
+        return {"title": f"Bytewatt ({host})"}
 
     client = AsyncModbusTcpClient(host, port=port)
 
     try:
-        # Attempt to connect with timeout
+        # Connect and validation read share one 10s deadline, so a slow connect
+        # eats into the read budget rather than doubling the worst case
         try:
-            connected = await asyncio.wait_for(client.connect(), timeout=10.0)
-        except TimeoutError:
-            raise CannotConnect("Connection timed out") from None
-
-        if not connected:
-            raise CannotConnect("Failed to connect to Modbus device")
+            async with asyncio.timeout(10.0):
+                connected = await client.connect()
+                if not connected:
+                    raise CannotConnect("Failed to connect to Modbus device")
 
-        # Try to read the export limit register as a validation test with timeout
-        try:
-            result = await asyncio.wait_for(
-                client.read_holding_registers(
+                # Read the export limit register as a validation test
+                result = await client.read_holding_registers(
                     address=REG_EXPORT_LIMIT,
                     count=2,  # 32-bit register
                     device_id=slave,
-                ),
-                timeout=10.0,
-            )
+                )
         except TimeoutError:
-            raise CannotConnect("Register read timed out") from None
+            raise CannotConnect("Connection timed out") from None
 
         if result.isError():
             _LOGGER.error("Failed to read register 0x%04X: %s", REG_EXPORT_LIMIT, result)
@@ -209,15 +268,15 @@ class BytewattConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_PRICE_ENTITY): selector.EntitySelector(
                     selector.EntitySelectorConfig(domain="sensor")
                 ),
-                vol.Required(CONF_PRICE_THRESHOLD, default=DEFAULT_PRICE_THRESHOLD): vol.All(
-                    vol.Coerce(float), vol.Range(min=-100.0, max=100.0)
-                ),
-                vol.Required(CONF_CURTAILED_LIMIT, default=DEFAULT_CURTAILED_LIMIT): vol.All(
-                    vol.Coerce(int), vol.Range(min=0, max=50000)
-                ),
-                vol.Optional(CONF_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL): vol.All(
-                    vol.Coerce(int), vol.Range(min=10, max=300)
-                ),
+                vol.Required(
+                    CONF_PRICE_THRESHOLD, default=DEFAULT_PRICE_THRESHOLD
+                ): _PRICE_THRESHOLD_SELECTOR,
+                vol.Required(
+                    CONF_CURTAILED_LIMIT, default=DEFAULT_CURTAILED_LIMIT
+                ): _CURTAILED_LIMIT_SELECTOR,
+                vol.Optional(
+                    CONF_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL
+                ): _POLL_INTERVAL_SELECTOR,
             }
         )
 
@@ -252,10 +311,10 @@ class BytewattOptionsFlow(config_entries.OptionsFlow):
         """Manage the options."""
         errors: dict[str, str] = {}
 
-        # Get current config values (prefer options, fallback to data)
-        current_price_entity = self.config_entry.options.get(
-            CONF_PRICE_ENTITY, self.config_entry.data.get(CONF_PRICE_ENTITY)
-        )
+        # Get current config values (prefer options, fallback to data) - merged
+        # once, the same way the coordinator reads its configuration
+        current = {**self.config_entry.data, **self.config_entry.options}
+        current_price_entity = current.get(CONF_PRICE_ENTITY)
 
         # Medium fix #7: Early validation - check if current price entity still exists
         if user_input is None and current_price_entity:
@@ -274,18 +333,9 @@ class BytewattOptionsFlow(config_entries.OptionsFlow):
             else:
                 return self.async_create_entry(title="", data=user_input)
 
-        current_price_threshold = self.config_entry.options.get(
-            CONF_PRICE_THRESHOLD,
-            self.config_entry.data.get(CONF_PRICE_THRESHOLD, DEFAULT_PRICE_THRESHOLD),
-        )
-        current_curtailed_limit = self.config_entry.options.get(
-            CONF_CURTAILED_LIMIT,
-            self.config_entry.data.get(CONF_CURTAILED_LIMIT, DEFAULT_CURTAILED_LIMIT),
-        )
-        current_poll_interval = self.config_entry.options.get(
-            CONF_POLL_INTERVAL,
-            self.config_entry.data.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL),
-        )
+        current_price_threshold = current.get(CONF_PRICE_THRESHOLD, DEFAULT_PRICE_THRESHOLD)
+        current_curtailed_limit = current.get(CONF_CURTAILED_LIMIT, DEFAULT_CURTAILED_LIMIT)
+        current_poll_interval = current.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
 
         # Build options schema
         options_schema = vol.Schema(
@@ -293,15 +343,15 @@ class BytewattOptionsFlow(config_entries.OptionsFlow):
                 vol.Required(
                     CONF_PRICE_ENTITY, default=current_price_entity
                 ): selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor")),
-                vol.Required(CONF_PRICE_THRESHOLD, default=current_price_threshold): vol.All(
-                    vol.Coerce(float), vol.Range(min=-100.0, max=100.0)
-                ),
-                vol.Required(CONF_CURTAILED_LIMIT, default=current_curtailed_limit): vol.All(
-                    vol.Coerce(int), vol.Range(min=0, max=50000)
-                ),
-                vol.Optional(CONF_POLL_INTERVAL, default=current_poll_interval): vol.All(
-                    vol.Coerce(int), vol.Range(min=10, max=300)
-                ),
+                vol.Required(
+                    CONF_PRICE_THRESHOLD, default=current_price_threshold
+                ): _PRICE_THRESHOLD_SELECTOR,
+                vol.Required(
+                    CONF_CURTAILED_LIMIT, default=current_curtailed_limit
+                ): _CURTAILED_LIMIT_SELECTOR,
+                vol.Optional(
+                    CONF_POLL_INTERVAL, default=current_poll_interval
+                ): _POLL_INTERVAL_SELECTOR,
             }
         )
 
@@ -1,5 +1,7 @@
 """Constants for the Bytewatt Export Limiter integration."""
 
+from typing import Final
+
 DOMAIN = "bytewatt_export_limiter"
 
 # Device info
@@ -16,6 +18,15 @@ DEFAULT_SLAVE = 85  # 0x55
 REG_EXPORT_LIMIT = 0x08A2  # Active export limit (W) - R/W
 REG_DER_CONTROL = 0x08A0  # DER dispatch control
 
+# Poll window - registers read in a single request on every poll, keyed by the
+# name they are reported under. New registers added here are coalesced into the
+# same block read as long as they stay close together.
+POLL_REGISTERS: Final[dict[str, int]] = {
+    "export_limit": REG_EXPORT_LIMIT,
+}
+POLL_BLOCK_START = min(POLL_REGISTERS.values())
+POLL_BLOCK_COUNT = max(POLL_REGISTERS.values()) - POLL_BLOCK_START + 1
+
 # Config keys
 CONF_MODBUS_HOST = "modbus_host"
 CONF_MODBUS_PORT = "modbus_port"
@@ -33,5 +44,13 @@ DEFAULT_POLL_INTERVAL = 60  # seconds
 # Debounce
 PRICE_DEBOUNCE_SECONDS = 5
 
-# Platforms (Low fix #20: Added type hint)
-PLATFORMS: list[str] = ["sensor", "binary_sensor", "number", "switch"]
+# Read the limit back shortly after a successful write so a grid override is
+# caught straight away rather than on the next scheduled poll
+POST_WRITE_VERIFY_SECONDS = 1
+
+# Grid override detection - runs whenever the polled limit changes, and
+# otherwise only on every Nth poll to re-check a steady reading
+OVERRIDE_CHECK_INTERVAL = 3  # polls
+
+# Platforms (Low fix #20: Added type hint) - immutable, shared across reloads
+PLATFORMS: Final[tuple[str, ...]] = ("sensor", "binary_sensor", "number", "switch")
@@ -13,12 +13,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import time
+import random
+import weakref
+from dataclasses import dataclass
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
@@ -31,18 +34,24 @@ from .const import (
     DEVICE_MANUFACTURER,
     DEVICE_MODEL,
     DOMAIN,
+    OVERRIDE_CHECK_INTERVAL,
+    POLL_BLOCK_COUNT,
+    POLL_BLOCK_START,
+    POLL_REGISTERS,
+    POST_WRITE_VERIFY_SECONDS,
     PRICE_DEBOUNCE_SECONDS,
     REG_EXPORT_LIMIT,
     SOFTWARE_VERSION,
 )
-from .modbus_client import AsyncModbusClient
+from .modbus_client import AsyncModbusClient, WriteSupersededError
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
 
 
-class BytewattCoordinatorData(TypedDict):
-    """Type definition for coordinator data structure."""
+@dataclass(slots=True, frozen=True)
+class BytewattCoordinatorData:
+    """Snapshot of coordinator state published to entities on each poll."""
 
     export_limit: int | None
     our_limit: int | None
@@ -54,8 +63,40 @@ class BytewattCoordinatorData(TypedDict):
 
 _LOGGER = logging.getLogger(__name__)
 
+# Poll retry backoff (seconds) - doubles per attempt up to the cap, plus jitter
+_RETRY_BASE_DELAY = 0.05
+_RETRY_MAX_DELAY = 0.4
+_RETRY_JITTER = 0.02
 
-class BytewattCoordinator(DataUpdateCoordinator):
+# Write failure backoff (seconds) - doubles per consecutive failure up to the cap
+_WRITE_BACKOFF_MAX = 60.0
+
+# Price entity states that carry no usable price
+_BAD_STATES = frozenset((STATE_UNAVAILABLE, STATE_UNKNOWN))
+
+
+@callback
+def _fire_price_debounce(coordinator_ref: weakref.ReferenceType[BytewattCoordinator]) -> None:
+    """
+    Debounce timer callback that holds the coordinator only weakly.
+
+    A pending timer must not keep an unloaded coordinator (and its Modbus
+    client) alive; if it has already been collected the expiry is a no-op.
+    """
+    coordinator = coordinator_ref()
+    if coordinator is not None:
+        coordinator._on_price_debounce_expired()
+
+
+@callback
+def _fire_write_verify(coordinator_ref: weakref.ReferenceType[BytewattCoordinator]) -> None:
+    """Post-write verify timer callback; holds the coordinator only weakly."""
+    coordinator = coordinator_ref()
+    if coordinator is not None:
+        coordinator._on_write_verify_due()
+
+
+class BytewattCoordinator(DataUpdateCoordinator[BytewattCoordinatorData]):
     """Coordinator to manage Bytewatt export limiter data and automation."""
 
     def __init__(
@@ -75,12 +116,25 @@ class BytewattCoordinator(DataUpdateCoordinator):
         self.modbus_client = modbus_client
         self.entry = entry  # Store entry for entity device_info
 
+        # Device info never changes for the lifetime of the entry - build it once
+        # rather than on every entity access
+        self._device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="Bytewatt Export Limiter",
+            manufacturer=DEVICE_MANUFACTURER,
+            model=DEVICE_MODEL,
+            sw_version=SOFTWARE_VERSION,
+        )
+
         # Extract configuration from entry data and options
         config = {**entry.data, **entry.options}
         poll_interval = config.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
         self.price_entity_id = config.get(CONF_PRICE_ENTITY)
         self.price_threshold = config.get(CONF_PRICE_THRESHOLD, 0.0)
         self.curtailed_limit = config.get(CONF_CURTAILED_LIMIT, 0)
+        # Last-write TTL is 3 poll cycles. The interval is fixed for the life of
+        # the coordinator - option changes reload the entry - so compute it once
+        self._ttl_seconds = float(poll_interval) * 3
 
         # State tracking
         # Note (Low fix #17): their_limit is initialized from first device read and
@@ -90,22 +144,50 @@ class BytewattCoordinator(DataUpdateCoordinator):
         self.their_limit: int | None = None  # Grid operator's limit
         self.our_limit: int | None = None  # Our manual override
         self.current_reading: int | None = None  # Current register value
+        self._poll_counter = 0  # Polls since setup - paces steady-state override checks
         self.automation_enabled: bool = False  # Price automation toggle
         self.current_price: float | None = None  # Current electricity price
-        # Track last write with timestamp for TTL (Medium fix #9)
-        # Tuple of (value, timestamp) - expires after 3 poll cycles
-        self._last_write: tuple[int, float] | None = None
+        # Last price state string seen and its parsed value (1-entry parse cache)
+        self._price_raw_cache: tuple[str, float] | None = None
+        # Track last write with an expiry for TTL (Medium fix #9) - the value is
+        # only trusted until 3 poll cycles after the write (0.0 = no write yet).
+        # Uses the event loop's monotonic clock so wall-clock jumps can't expire it early
+        self._last_write_value: int | None = None
+        self._last_write_expiry: float = 0.0
         self._write_in_progress: bool = False  # High fix #2 - prevent false override detection
-
-        # Debouncing
-        self._price_debounce_task: asyncio.Task[None] | None = None
+        # Last limit known to be on the device - identical writes are skipped.
+        # Cleared whenever a poll reads back something else (drift/external change)
+        self._last_written_limit: int | None = None
+        self._writes_saved = 0  # Writes skipped because the device already held the value
+        # Consecutive write failures and the loop time before which writes are
+        # refused, so a flapping link isn't hit with a write on every poll
+        self._write_fail_count = 0
+        self._write_skip_until: float = 0.0
+        # Serializes price-logic runs so concurrent callers can't race their writes
+        self._price_logic_lock = asyncio.Lock()
+        # Inputs of the last successful price-logic run; identical inputs are skipped
+        self._price_logic_inputs: tuple[Any, ...] | None = None
+
+        # Debouncing - each price change only pushes the deadline out; a single
+        # timer is armed per quiet window and re-arms itself for the remainder
+        # if the deadline moved. Tasks only exist while the debounced logic is
+        # actually running and drop themselves from the set when done
+        self._price_debounce_handle: asyncio.TimerHandle | None = None
+        self._price_debounce_deadline: float = 0.0
+        self._price_debounce_tasks: set[asyncio.Task[None]] = set()
         self._price_change_cancel: Any = None
 
+        # Post-write verification - one pending read-back at a time
+        self._verify_write_handle: asyncio.TimerHandle | None = None
+        self._verify_write_task: asyncio.Task[None] | None = None
+
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=poll_interval),
+            # Only notify entities when the published snapshot actually changes
+            always_update=False,
         )
 
     async def async_setup(self) -> None:
@@ -126,10 +208,7 @@ class BytewattCoordinator(DataUpdateCoordinator):
 
             # Get initial price value
             price_state = self.hass.states.get(self.price_entity_id)
-            if price_state and price_state.state not in (
-                STATE_UNAVAILABLE,
-                STATE_UNKNOWN,
-            ):
+            if price_state and price_state.state not in _BAD_STATES:
                 try:
                     self.current_price = float(price_state.state)
                     _LOGGER.debug("Initial price: %s", self.current_price)
@@ -146,24 +225,25 @@ class BytewattCoordinator(DataUpdateCoordinator):
             self._price_change_cancel()
             self._price_change_cancel = None
 
-        # Cancel any pending debounce tasks
-        if self._price_debounce_task and not self._price_debounce_task.done():
-            self._price_debounce_task.cancel()
-            try:
-                await self._price_debounce_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel any pending debounce timer and running debounce tasks, and
+        # wait for the cancellations to land
+        self._cancel_price_debounce()
+        if tasks := self._cancel_price_tasks():
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Same for a pending post-write verification
+        if self._verify_write_handle is not None:
+            self._verify_write_handle.cancel()
+            self._verify_write_handle = None
+        task = self._verify_write_task
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
 
     @property
-    def device_info(self) -> dict[str, Any]:
+    def device_info(self) -> DeviceInfo:
         """Return device information for entities to use."""
-        return {
-            "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": "Bytewatt Export Limiter",
-            "manufacturer": DEVICE_MANUFACTURER,
-            "model": DEVICE_MODEL,
-            "sw_version": SOFTWARE_VERSION,
-        }
+        return self._device_info
 
     @callback
     def _handle_price_change(self, event: Event) -> None:
@@ -177,42 +257,108 @@ class BytewattCoordinator(DataUpdateCoordinator):
         if not new_state:
             return
 
+        # Attribute-only updates (e.g. forecast attributes on price sensors)
+        # keep the same state - nothing to parse or debounce
+        old_state: State | None = event.data.get("old_state")
+        raw = new_state.state
+        if old_state is not None and old_state.state == raw:
+            return
+
         # Critical fix #2: Set current_price to None when entity unavailable
         # to avoid using stale price data
-        if new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        if raw in _BAD_STATES:
             if self.current_price is not None:
                 _LOGGER.warning("Price entity became unavailable, clearing current_price")
                 self.current_price = None
             return
 
-        try:
-            new_price = float(new_state.state)
-        except (ValueError, TypeError):
-            _LOGGER.warning("Could not parse price state: %s", new_state.state)
+        # Price sensors repeat the same few strings - reuse the last parse
+        cache = self._price_raw_cache
+        if cache is not None and cache[0] == raw:
+            new_price = cache[1]
+        else:
+            try:
+                new_price = float(raw)
+            except (ValueError, TypeError):
+                _LOGGER.warning("Could not parse price state: %s", raw)
+                return
+            self._price_raw_cache = (raw, new_price)
+
+        # Re-posted or differently formatted values parse to the same price -
+        # nothing changed, so leave any pending debounce alone
+        old_price = self.current_price
+        if new_price == old_price:
             return
 
         # Update current price immediately
-        old_price = self.current_price
         self.current_price = new_price
 
-        _LOGGER.debug("Price changed: %s -> %s", old_price, new_price)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Price changed: %s -> %s", old_price, new_price)
+
+        # The price logic only acts on which side of the threshold the price is.
+        # A move that stays on the same side can't change the target limit, so
+        # there is nothing to debounce (polls still re-apply the decision)
+        if self.automation_enabled and old_price is not None:
+            threshold = self.price_threshold
+            if (old_price <= threshold) == (new_price <= threshold):
+                return
+
+        # Push the debounce deadline out. Only the first change in a quiet
+        # window arms a timer - later ones are a float store, no timer churn
+        self._price_debounce_deadline = self.hass.loop.time() + PRICE_DEBOUNCE_SECONDS
+        if self._price_debounce_handle is None:
+            self._arm_price_debounce()
+
+    def _arm_price_debounce(self) -> None:
+        """Arm the debounce timer for the current deadline."""
+        self._price_debounce_handle = self.hass.loop.call_at(
+            self._price_debounce_deadline, _fire_price_debounce, weakref.ref(self)
+        )
 
-        # Cancel existing debounce task if any
-        if self._price_debounce_task and not self._price_debounce_task.done():
-            self._price_debounce_task.cancel()
+    def _cancel_price_debounce(self) -> None:
+        """Cancel the pending price debounce timer, if armed."""
+        if self._price_debounce_handle is not None:
+            self._price_debounce_handle.cancel()
+            self._price_debounce_handle = None
 
-        # Create new debounced task
-        self._price_debounce_task = self.hass.async_create_task(self._debounced_price_update())
+    def _cancel_price_tasks(self) -> list[asyncio.Task[None]]:
+        """
+        Cancel any running debounced price tasks.
+
+        Returns:
+            The tasks that were cancelled, for callers that want to await them
+        """
+        tasks = [task for task in self._price_debounce_tasks if not task.done()]
+        for task in tasks:
+            task.cancel()
+        return tasks
+
+    @callback
+    def _on_price_debounce_expired(self) -> None:
+        """Start the debounced price update once the price has settled."""
+        if self.hass.loop.time() < self._price_debounce_deadline:
+            # Price changed again since the timer was armed - wait out the rest
+            self._arm_price_debounce()
+            return
+        self._price_debounce_handle = None
+        # Background task - short-lived and cancellation-friendly, so it doesn't
+        # need to hold up HA startup/shutdown like a tracked task would
+        task = self.hass.async_create_background_task(
+            self._debounced_price_update(), name="bytewatt_price_debounce"
+        )
+        self._price_debounce_tasks.add(task)
+        task.add_done_callback(self._price_debounce_tasks.discard)
 
     async def _debounced_price_update(self) -> None:
-        """Wait for debounce period, then apply price-based logic."""
+        """Apply price-based logic after the debounce period has expired."""
         try:
-            await asyncio.sleep(PRICE_DEBOUNCE_SECONDS)
-            _LOGGER.debug(
-                "Price debounce expired, applying logic (price: %s, threshold: %s)",
-                self.current_price,
-                self.price_threshold,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Price debounce expired, applying logic (price: %s, threshold: %s)",
+                    self.current_price,
+                    self.price_threshold,
+                )
             await self._apply_price_logic()
         except asyncio.CancelledError:
             _LOGGER.debug("Price debounce cancelled")
@@ -220,6 +366,42 @@ class BytewattCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.exception("Error in debounced price update: %s", err)
 
+    def _schedule_write_verify(self) -> None:
+        """
+        Arm a one-off refresh shortly after a successful write.
+
+        The refresh reads the limit back and runs the usual override detection,
+        so a grid change racing our write is handled within a second or so.
+        Writes made by the verification refresh itself (e.g. a re-apply) don't
+        schedule another one - the regular poll follows up on those.
+        """
+        if self._verify_write_handle is not None:
+            return
+        task = self._verify_write_task
+        if task is not None and not task.done():
+            return
+        self._verify_write_handle = self.hass.loop.call_later(
+            POST_WRITE_VERIFY_SECONDS, _fire_write_verify, weakref.ref(self)
+        )
+
+    @callback
+    def _on_write_verify_due(self) -> None:
+        """Start the post-write verification refresh."""
+        self._verify_write_handle = None
+        self._verify_write_task = self.hass.async_create_background_task(
+            self._verify_write(), name="bytewatt_write_verify"
+        )
+
+    async def _verify_write(self) -> None:
+        """Refresh from the device to confirm the last write stuck."""
+        try:
+            await self.async_refresh()
+        except asyncio.CancelledError:
+            _LOGGER.debug("Post-write verification cancelled")
+            raise
+        except Exception as err:
+            _LOGGER.exception("Error verifying export limit write: %s", err)
+
     async def _fetch_data(self, max_retries: int = 2) -> dict[str, Any]:
         """
         Fetch data from Modbus registers with retry logic (Medium fix #8).
@@ -233,21 +415,34 @@ class BytewattCoordinator(DataUpdateCoordinator):
         last_error = None
 
         for attempt in range(max_retries + 1):
-            # Read export limit register (0x08A2) - 16-bit value
-            export_limit = await self.modbus_client.read_register_single(REG_EXPORT_LIMIT)
-            if export_limit is None:
+            # Read the whole poll window in one request and slice locally
+            block = await self.modbus_client.read_block(POLL_BLOCK_START, POLL_BLOCK_COUNT)
+            if block is None:
                 last_error = "Failed to read export limit register"
                 if attempt < max_retries:
-                    _LOGGER.debug("Retry %d/%d: %s", attempt + 1, max_retries, last_error)
-                    await asyncio.sleep(0.5)  # Brief delay before retry
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Retry %d/%d: %s", attempt + 1, max_retries, last_error)
+                    # A failure that dropped the connection is retried at once -
+                    # the client reconnects on the next request. Otherwise back
+                    # off exponentially with a little jitter.
+                    if attempt == 0 and not self.modbus_client.is_connected:
+                        continue
+                    await asyncio.sleep(
+                        min(_RETRY_BASE_DELAY * (2**attempt), _RETRY_MAX_DELAY)
+                        + random.random() * _RETRY_JITTER
+                    )
                     continue
                 raise UpdateFailed(last_error)
 
-            _LOGGER.debug("Polled register: export_limit=%s", export_limit)
-
-            return {
-                "export_limit": export_limit,
+            # Decode each register by its offset into the block
+            # (export limit at 0x08A2 is a 16-bit value)
+            data = {
+                name: block[address - POLL_BLOCK_START] for name, address in POLL_REGISTERS.items()
             }
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Polled registers: %s", data)
+
+            return data
 
         # Should not reach here, but just in case
         raise UpdateFailed(last_error or "Unknown error fetching data")
@@ -271,83 +466,108 @@ class BytewattCoordinator(DataUpdateCoordinator):
         export_limit = raw_data["export_limit"]
 
         # Update current reading
+        reading_changed = export_limit != self.current_reading
         self.current_reading = export_limit
+        poll_count = self._poll_counter + 1
+        self._poll_counter = poll_count
+
+        # Device no longer holds what we last wrote - next write must go out
+        last_written = self._last_written_limit
+        if last_written is not None and export_limit != last_written:
+            self._last_written_limit = None
 
         # Initialize their_limit on first read (Critical fix #1)
         if self.their_limit is None:
             self.their_limit = export_limit
-            _LOGGER.info("Initialized their_limit from first read: %s", self.their_limit)
-
-        # Get poll interval for TTL calculation
-        poll_interval = (
-            self.update_interval.total_seconds() if self.update_interval else DEFAULT_POLL_INTERVAL
-        )
+            _LOGGER.info("Initialized their_limit from first read: %s", export_limit)
 
         # Check for grid override (High fix #2, Medium fix #9)
-        # Skip if write is in progress to avoid false detection
-        # Check TTL on last write - expire after 3 poll cycles (default 180s)
-        last_write_value = None
-        if self._last_write is not None:
-            write_value, write_time = self._last_write
-            ttl_seconds = poll_interval * 3
-            if time.time() - write_time < ttl_seconds:
-                last_write_value = write_value
-            else:
-                self._last_write = None  # Expired
-
-        # Check for changes to the export limit register
-        # Skip if this is our own write echoing back, or write in progress
-        if self.current_reading != last_write_value and not self._write_in_progress:
-            if self.our_limit is not None:
-                # CURTAILMENT MODE: we're actively curtailing
-                if self.current_reading != self.our_limit:
-                    # Grid overrode our curtailment
-                    _LOGGER.info(
-                        "Grid override detected: our_limit=%s, current=%s",
-                        self.our_limit,
-                        self.current_reading,
-                    )
-                    # Update their_limit to the new grid-imposed value
-                    self.their_limit = self.current_reading
+        # Skip entirely while a write is in progress to avoid false detection.
+        # A changed reading is checked straight away; a steady one only needs
+        # re-checking every few polls (e.g. to retry a failed re-apply)
+        if not self._write_in_progress and (
+            reading_changed or poll_count % OVERRIDE_CHECK_INTERVAL == 0
+        ):
+            # Check TTL on last write - expire after 3 poll cycles (default 180s)
+            last_write_value = (
+                self._last_write_value if self.hass.loop.time() < self._last_write_expiry else None
+            )
 
-                    # Re-apply our curtailment if it's lower than their new limit
-                    if self.our_limit < self.their_limit:
+            # Check for changes to the export limit register
+            # Skip if this is our own write echoing back
+            if export_limit != last_write_value:
+                our_limit = self.our_limit
+                if our_limit is not None:
+                    # CURTAILMENT MODE: we're actively curtailing
+                    if export_limit != our_limit:
+                        # Grid overrode our curtailment
                         _LOGGER.info(
-                            "Re-applying curtailment %s (grid set %s)",
-                            self.our_limit,
-                            self.their_limit,
+                            "Grid override detected: our_limit=%s, current=%s",
+                            our_limit,
+                            export_limit,
                         )
-                        await self._write_limit(self.our_limit)
-            else:
-                # HANDS-OFF MODE: just track grid changes to their_limit
-                if self.current_reading != self.their_limit:
+                        # Update their_limit to the new grid-imposed value
+                        self.their_limit = export_limit
+
+                        # Re-apply our curtailment if it's lower than their new limit
+                        if our_limit < export_limit:
+                            _LOGGER.info(
+                                "Re-applying curtailment %s (grid set %s)",
+                                our_limit,
+                                export_limit,
+                            )
+                            await self._write_limit(our_limit)
+                elif export_limit != self.their_limit:
+                    # HANDS-OFF MODE: just track grid changes to their_limit
                     _LOGGER.info(
                         "Grid changed limit: %s -> %s (hands-off mode)",
                         self.their_limit,
-                        self.current_reading,
+                        export_limit,
                     )
-                    self.their_limit = self.current_reading
+                    self.their_limit = export_limit
 
-        # Apply price-based automation logic
-        await self._apply_price_logic()
+        # Apply price-based automation logic - checked here so polls with
+        # automation off (the common case) don't create the coroutine at all
+        if self.automation_enabled:
+            await self._apply_price_logic()
 
         # Determine if currently curtailed (High fix #8)
-        # Curtailed = current export limit is lower than the grid's limit
-        is_curtailed = False
-        if self.current_reading is not None and self.their_limit is not None:
-            is_curtailed = self.current_reading < self.their_limit
-
-        # Build data dictionary for entities
-        return {
-            "export_limit": self.current_reading,
-            "our_limit": self.our_limit,
-            "their_limit": self.their_limit,
-            "current_price": self.current_price,
-            "is_curtailed": is_curtailed,
-            "automation_enabled": self.automation_enabled,
-        }
-
-    async def _apply_price_logic(self) -> None:
+        # Curtailed = current export limit is lower than the grid's limit.
+        # Re-read the reading - a write during this poll updates it optimistically
+        export_limit = self.current_reading
+        their_limit = self.their_limit
+        our_limit = self.our_limit
+        current_price = self.current_price
+        automation_enabled = self.automation_enabled
+        is_curtailed = (
+            export_limit is not None and their_limit is not None and export_limit < their_limit
+        )
+
+        # Steady state: nothing changed since the last poll, so hand back the
+        # previous snapshot instead of allocating an identical one
+        prev = self.data
+        if (
+            prev is not None
+            and prev.export_limit == export_limit
+            and prev.our_limit == our_limit
+            and prev.their_limit == their_limit
+            and prev.current_price == current_price
+            and prev.is_curtailed == is_curtailed
+            and prev.automation_enabled == automation_enabled
+        ):
+            return prev
+
+        # Build data snapshot for entities
+        return BytewattCoordinatorData(
+            export_limit=export_limit,
+            our_limit=our_limit,
+            their_limit=their_limit,
+            current_price=current_price,
+            is_curtailed=is_curtailed,
+            automation_enabled=automation_enabled,
+        )
+
+    async def _apply_price_logic(self, force: bool = False) -> None:
         """
         Apply price-based automation logic.
 
@@ -355,79 +575,180 @@ class BytewattCoordinator(DataUpdateCoordinator):
         - If automation_enabled AND price <= threshold: curtail (set our_limit)
         - If automation_enabled AND price > threshold: restore to their_limit (clear our_limit)
         - When our_limit is None, we're in hands-off mode and don't re-apply on override
+
+        Polls, the debounced price task and set_automation_enabled can all get
+        here at once; calls are serialized so their writes never interleave.
+        A run whose inputs match the last successful run is skipped.
+
+        Args:
+            force: Re-evaluate even if the inputs are unchanged
+        """
+        async with self._price_logic_lock:
+            await self._apply_price_logic_unlocked(force)
+
+    async def _apply_price_logic_unlocked(self, force: bool = False) -> None:
         """
+        Apply price-based automation logic without acquiring the lock.
+
+        Must be called while holding _price_logic_lock.
+
+        Args:
+            force: Re-evaluate even if the inputs are unchanged
+        """
+        # Runs on every poll with automation on - skip building debug args when
+        # DEBUG is off (the default)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
         if not self.automation_enabled:
-            _LOGGER.debug("Automation disabled, skipping price logic")
+            if debug:
+                _LOGGER.debug("Automation disabled, skipping price logic")
             return
 
-        if self.current_price is None:
-            _LOGGER.debug("No price data available, skipping price logic")
+        # Bind state to locals once - each is read several times below
+        price = self.current_price
+        their_limit = self.their_limit
+        curtailed_limit = self.curtailed_limit
+        threshold = self.price_threshold
+        reading = self.current_reading
+
+        inputs = (price, their_limit, reading, curtailed_limit, threshold)
+        if self._price_inputs_unchanged(inputs, force, debug):
             return
 
-        if self.their_limit is None:
-            _LOGGER.debug("No their_limit set, skipping price logic")
+        if price is None:
+            if debug:
+                _LOGGER.debug("No price data available, skipping price logic")
+            return
+
+        if their_limit is None:
+            if debug:
+                _LOGGER.debug("No their_limit set, skipping price logic")
             return
 
         # Guard against None curtailed_limit (Critical fix #4)
-        if self.curtailed_limit is None:
+        if curtailed_limit is None:
             _LOGGER.warning("curtailed_limit is None, skipping price logic")
             return
 
-        # High fix #4: Re-check current_price right before comparison
-        # to handle race where price becomes None between earlier check and here
-        if self.current_price is None:
-            _LOGGER.debug("Price became None during logic, skipping")
-            return
+        # Determine target limit and mode based on price, then write it if needed
+        target_limit, is_curtailing = self._price_target(
+            price, threshold, their_limit, curtailed_limit, debug
+        )
+        await self._apply_price_target(target_limit, is_curtailing, inputs, debug)
+
+    def _price_inputs_unchanged(self, inputs: tuple[Any, ...], force: bool, debug: bool) -> bool:
+        """
+        Check whether the price logic already ran on these exact inputs.
+
+        The same inputs always lead to the same decision, so a repeat run
+        has nothing to do.
 
-        # Determine target limit and mode based on price
-        if self.current_price <= self.price_threshold:
+        Args:
+            inputs: (price, their_limit, reading, curtailed_limit, threshold)
+            force: Re-evaluate even if the inputs are unchanged
+            debug: Whether DEBUG logging is enabled
+
+        Returns:
+            True if the run can be skipped
+        """
+        if force or inputs != self._price_logic_inputs:
+            return False
+        if debug:
+            _LOGGER.debug("Price logic inputs unchanged, skipping")
+        return True
+
+    @staticmethod
+    def _price_target(
+        price: float, threshold: float, their_limit: int, curtailed_limit: int, debug: bool
+    ) -> tuple[int, bool]:
+        """
+        Pick the export limit the current price calls for.
+
+        Args:
+            price: Current electricity price
+            threshold: Price at or below which exports are curtailed
+            their_limit: Grid operator's limit, restored above the threshold
+            curtailed_limit: Limit applied at or below the threshold
+            debug: Whether DEBUG logging is enabled
+
+        Returns:
+            (target limit, whether it is a curtailment)
+        """
+        if price <= threshold:
             # CURTAIL MODE: actively limiting exports
-            target_limit = self.curtailed_limit
-            is_curtailing = True
-            _LOGGER.debug(
-                "Price %s <= threshold %s, curtailing to %s",
-                self.current_price,
-                self.price_threshold,
-                target_limit,
-            )
-        else:
-            # RESTORE MODE: restore to their_limit, then hands-off
-            target_limit = self.their_limit
-            is_curtailing = False
+            if debug:
+                _LOGGER.debug(
+                    "Price %s <= threshold %s, curtailing to %s",
+                    price,
+                    threshold,
+                    curtailed_limit,
+                )
+            return curtailed_limit, True
+
+        # RESTORE MODE: restore to their_limit, then hands-off
+        if debug:
             _LOGGER.debug(
                 "Price %s > threshold %s, restoring to their_limit=%s",
-                self.current_price,
-                self.price_threshold,
-                target_limit,
+                price,
+                threshold,
+                their_limit,
             )
+        return their_limit, False
+
+    async def _apply_price_target(
+        self,
+        target_limit: int,
+        is_curtailing: bool,
+        inputs: tuple[Any, ...],
+        debug: bool,
+    ) -> None:
+        """
+        Write the target limit if the device doesn't already hold it.
+
+        Args:
+            target_limit: Export limit the price logic wants
+            is_curtailing: Whether target_limit is a curtailment
+            inputs: (price, their_limit, reading, curtailed_limit, threshold)
+            debug: Whether DEBUG logging is enabled
+        """
+        price, their_limit, reading, curtailed_limit, threshold = inputs
 
         # Only write if target differs from current reading
-        if target_limit != self.current_reading:
-            _LOGGER.info(
-                "Applying price-based limit: %s (current: %s, price: %s, curtailing: %s)",
-                target_limit,
-                self.current_reading,
-                self.current_price,
-                is_curtailing,
-            )
-            success = await self._write_limit(target_limit)
-            if success:
-                if is_curtailing:
-                    # Set our_limit so we re-apply if grid overrides
-                    self.our_limit = target_limit
-                else:
-                    # Clear our_limit - we're now hands-off
-                    self.our_limit = None
-        else:
-            _LOGGER.debug(
-                "Target limit %s matches current reading, no write needed",
-                target_limit,
-            )
+        if target_limit == reading:
+            if debug:
+                _LOGGER.debug(
+                    "Target limit %s matches current reading, no write needed",
+                    target_limit,
+                )
             # Still update our_limit state even if no write needed
-            if is_curtailing:
-                self.our_limit = self.curtailed_limit
-            else:
-                self.our_limit = None
+            self.our_limit = curtailed_limit if is_curtailing else None
+            self._price_logic_inputs = inputs
+            return
+
+        _LOGGER.info(
+            "Applying price-based limit: %s (current: %s, price: %s, curtailing: %s)",
+            target_limit,
+            reading,
+            price,
+            is_curtailing,
+        )
+        if not await self._write_limit(target_limit):
+            # Failed write - make sure the next call tries again
+            self._price_logic_inputs = None
+            return
+
+        # Set our_limit so we re-apply if grid overrides; clear it when
+        # restoring - we're now hands-off
+        self.our_limit = target_limit if is_curtailing else None
+        # The reading now reflects our write; remember that as the input
+        # state so the next identical call is a no-op
+        self._price_logic_inputs = (
+            price,
+            their_limit,
+            self.current_reading,
+            curtailed_limit,
+            threshold,
+        )
 
     async def _write_limit(self, value: int) -> bool:
         """
@@ -437,20 +758,66 @@ class BytewattCoordinator(DataUpdateCoordinator):
             value: Export limit in watts
 
         Returns:
-            True on success, False on error
+            True on success or if a newer limit replaced it before it was sent,
+            False on error
         """
+        # Skip the round trip if the device already holds this value
+        if value == self._last_written_limit:
+            self._writes_saved += 1
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Export limit %s W already written, skipping", value)
+            return True
+
+        now = self.hass.loop.time()
+        if now < self._write_skip_until:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Backing off after %d failed writes, not writing %s W for %.1fs",
+                    self._write_fail_count,
+                    value,
+                    self._write_skip_until - now,
+                )
+            return False
+
         _LOGGER.info("Writing export limit: %s W", value)
 
         # Set write-in-progress flag to prevent false override detection (High fix #2)
         self._write_in_progress = True
         try:
-            success = await self.modbus_client.write_register(REG_EXPORT_LIMIT, value)
+            # Shielded so cancelling the caller (e.g. an entry reload mid-poll)
+            # can't tear down a request already on the wire; the cancellation
+            # still reaches us afterwards and the finally below still runs
+            try:
+                success = await asyncio.shield(
+                    self.modbus_client.write_register(REG_EXPORT_LIMIT, value)
+                )
+            except WriteSupersededError:
+                # Another caller queued a newer limit before this one went out.
+                # Nothing failed - the newer write updates the bookkeeping below
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Export limit %s W superseded by a newer write", value)
+                return True
 
             if success:
-                # Track last write with timestamp for TTL (Medium fix #9)
-                self._last_write = (value, time.time())
-                _LOGGER.debug("Successfully wrote limit %s", value)
+                self._write_fail_count = 0
+                self._write_skip_until = 0.0
+                # Track last write with its expiry for TTL (Medium fix #9)
+                self._last_write_value = value
+                self._last_write_expiry = self.hass.loop.time() + self._ttl_seconds
+                self._last_written_limit = value
+                # Optimistically assume the device now holds the value so logic
+                # later in this cycle doesn't re-issue it; the next poll reconciles
+                self.current_reading = value
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Successfully wrote limit %s", value)
+                self._schedule_write_verify()
             else:
+                self._last_written_limit = None
+                fail_count = self._write_fail_count + 1
+                self._write_fail_count = fail_count
+                self._write_skip_until = self.hass.loop.time() + min(
+                    _WRITE_BACKOFF_MAX, 2.0**fail_count
+                )
                 _LOGGER.error(
                     "Failed to write limit %s to register 0x%04X", value, REG_EXPORT_LIMIT
                 )
@@ -472,8 +839,10 @@ class BytewattCoordinator(DataUpdateCoordinator):
         Returns:
             True on success, False on error
         """
-        if not 0 <= value <= 0xFFFFFFFF:  # 32-bit unsigned max
-            _LOGGER.error("Invalid export limit value: %s (must be 0-4294967295)", value)
+        # REG_EXPORT_LIMIT is a single 16-bit register - anything wider would be
+        # silently truncated by the write
+        if not 0 <= value <= 0xFFFF:
+            _LOGGER.error("Invalid export limit value: %s (must be 0-65535)", value)
             return False
 
         _LOGGER.info("Manual export limit set: %s W", value)
@@ -485,19 +854,28 @@ class BytewattCoordinator(DataUpdateCoordinator):
             # Only update our_limit AFTER successful write
             self.our_limit = value
             # Trigger coordinator update to refresh entities (Medium fix #10)
-            await self._safe_request_refresh()
+            # Bounded - the caller is waiting on a service call
+            await self._safe_request_refresh(timeout=30.0)
 
         return success
 
-    async def _safe_request_refresh(self, timeout: float = 30.0) -> None:
+    async def _safe_request_refresh(self, timeout: float | None = None) -> None:
         """
-        Request coordinator refresh with timeout (Medium fix #10).
+        Request coordinator refresh, optionally bounded by a timeout (Medium fix #10).
+
+        async_request_refresh goes through the coordinator's debouncer and
+        normally returns almost immediately, so it is awaited directly unless
+        a timeout is given. With a timeout the refresh is shielded, so giving
+        up on the wait does not cancel the refresh itself.
 
         Args:
-            timeout: Maximum time to wait for refresh in seconds
+            timeout: Maximum time to wait for refresh in seconds, or None to not bound it
         """
         try:
-            await asyncio.wait_for(self.async_request_refresh(), timeout=timeout)
+            if timeout is None:
+                await self.async_request_refresh()
+            else:
+                await asyncio.wait_for(asyncio.shield(self.async_request_refresh()), timeout)
         except TimeoutError:
             _LOGGER.warning("Coordinator refresh timed out after %ss", timeout)
         except Exception as err:
@@ -516,18 +894,24 @@ class BytewattCoordinator(DataUpdateCoordinator):
             enabled: True to enable automation, False to disable
         """
         old_state = self.automation_enabled
+        if enabled == old_state:
+            # Redundant toggle (e.g. a UI re-sending the current state) - no
+            # price logic, revert or refresh to do
+            _LOGGER.debug("Automation already %s, nothing to do", enabled)
+            return
         self.automation_enabled = enabled
 
         _LOGGER.info("Automation %s -> %s", old_state, enabled)
 
         if enabled:
-            # Immediately apply price logic when enabling
-            await self._apply_price_logic()
+            # Immediately apply price logic when enabling - always re-evaluate,
+            # whatever the last run decided
+            await self._apply_price_logic(force=True)
         else:
-            # High fix #5: Cancel any pending price debounce task
+            # High fix #5: Cancel any pending price debounce timer/task
             # to prevent queued automation from triggering after disable
-            if self._price_debounce_task and not self._price_debounce_task.done():
-                self._price_debounce_task.cancel()
+            self._cancel_price_debounce()
+            if self._cancel_price_tasks():
                 _LOGGER.debug("Cancelled pending price debounce task")
             # When disabling, revert to their_limit if we were curtailing
             if (
@@ -9,9 +9,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import socket
+import struct
+from collections.abc import Sequence
+from dataclasses import dataclass
 
 from pymodbus.client import AsyncModbusTcpClient
-from pymodbus.exceptions import ModbusException
+from pymodbus.exceptions import ConnectionException, ModbusException
 
 from .const import DEFAULT_PORT, DEFAULT_SLAVE
 
@@ -20,6 +24,16 @@ _LOGGER = logging.getLogger(__name__)
 # Default connection settings (DEFAULT_PORT and DEFAULT_SLAVE imported from const.py)
 DEFAULT_TIMEOUT = 10  # seconds
 
+# Retry backoff for multi-register writes (seconds) - doubles per attempt
+WRITE_RETRY_BASE_DELAY = 0.1
+WRITE_RETRY_MAX_DELAY = 1.0
+
+# Connection reuse - consecutive request errors tolerated before the socket is
+# torn down, and pymodbus's own reconnect backoff (seconds) for dropped links
+ERROR_RESET_THRESHOLD = 5
+RECONNECT_DELAY = 0.3
+RECONNECT_DELAY_MAX = 5.0
+
 # Register addresses (commonly used)
 REG_BATTERY_VOLTAGE = 0x0100
 REG_BATTERY_CURRENT = 0x0101
@@ -30,15 +44,104 @@ REG_MAX_FEED_GRID_PCT = 0x0800
 REG_PV_CAPACITY_STORAGE = 0x0801  # 32-bit value
 REG_SYSTEM_MODE = 0x0805
 
+# Big-endian codecs for 32-bit values spread over two registers (high word
+# first). Built once and reused for every conversion
+_U32_BE = struct.Struct(">I")
+_U16X2_BE = struct.Struct(">HH")
+
+# Register windows read in one request by the block helpers
+BATTERY_BLOCK_START = REG_BATTERY_VOLTAGE
+BATTERY_BLOCK_COUNT = REG_BATTERY_STATUS - BATTERY_BLOCK_START + 1
+CONFIG_BLOCK_START = REG_MAX_FEED_GRID_PCT
+CONFIG_BLOCK_COUNT = REG_SYSTEM_MODE - CONFIG_BLOCK_START + 1
+
+# Config block layout - the registers are re-packed as big-endian words and
+# every field decoded in one unpack, 32-bit handling included.
+# Max feed pct (u16), PV capacity (u32), 2 unused words, system mode (u16)
+_CONFIG_WORDS = struct.Struct(f">{CONFIG_BLOCK_COUNT}H")
+_CONFIG_FIELDS = struct.Struct(">HI4xH")
+
+
+def _s16(value: int) -> int:
+    """Reinterpret an unsigned 16-bit register value as signed."""
+    return (value ^ 0x8000) - 0x8000
+
+
+# Scaled telemetry registers: (divisor, signed). Dividing by the integer
+# ratio rather than multiplying by 0.1 keeps results exact (e.g. 3 -> 0.3)
+_REGISTER_SCALES: dict[int, tuple[int, bool]] = {
+    REG_BATTERY_VOLTAGE: (10, False),
+    REG_BATTERY_CURRENT: (10, True),
+    REG_BATTERY_SOC: (10, False),
+    REG_BATTERY_POWER: (1, True),
+}
+
+
+def _decode_int(address: int, raw: int) -> int:
+    """
+    Convert a raw register value to its unscaled integer value.
+
+    Args:
+        address: Register address, which must be in _REGISTER_SCALES
+        raw: Raw unsigned 16-bit register value
+
+    Returns:
+        The value, sign-extended for signed registers. Only meaningful as the
+        engineering value for registers with a divisor of 1
+    """
+    signed = _REGISTER_SCALES[address][1]
+    return _s16(raw) if signed else raw
+
+
+def _decode(address: int, raw: int) -> float:
+    """
+    Convert a raw register value to its scaled engineering value.
+
+    Args:
+        address: Register address, which must be in _REGISTER_SCALES
+        raw: Raw unsigned 16-bit register value
+
+    Returns:
+        The value divided by the register's scale
+    """
+    return _decode_int(address, raw) / _REGISTER_SCALES[address][0]
+
+
+class WriteSupersededError(Exception):
+    """A queued write was replaced by a newer value before it was sent."""
+
+
+@dataclass(slots=True, frozen=True)
+class BatteryReadings:
+    """Battery telemetry decoded from one battery block read."""
+
+    voltage: float  # V
+    current: float  # A, positive=discharge, negative=charge
+    soc: float  # %
+    status: int
+    power: int  # W, positive=discharge, negative=charge
+
+
+@dataclass(slots=True, frozen=True)
+class ConfigReadings:
+    """Inverter configuration decoded from one config block read."""
+
+    max_feed_grid_pct: int
+    pv_capacity_storage: int
+    system_mode: int
+
 
 class AsyncModbusClient:
     """
     Thread-safe async Modbus TCP client for Bytewatt battery system.
 
-    Note (Low fix #16): This client does not implement heartbeat/keep-alive.
-    Connection state is only verified during read/write operations.
-    If the network connection drops between operations, the next operation
-    will fail and trigger a reconnection attempt via _ensure_connected().
+    Note (Low fix #16): This client does not implement an application-level
+    heartbeat; TCP keep-alive is enabled on the socket where pymodbus exposes
+    it. Connection state is otherwise only verified during read/write operations.
+    If the network connection drops between operations, _ensure_connected()
+    notices the closed transport and reconnects before the next request; a
+    drop pymodbus has not yet seen will fail that operation and reconnect on
+    the one after. The same pymodbus client is reused across reconnects.
     The default poll interval (60s) determines maximum staleness detection time.
     """
 
@@ -64,8 +167,24 @@ class AsyncModbusClient:
         self.timeout = timeout
 
         self._client: AsyncModbusTcpClient | None = None
-        self._lock = asyncio.Lock()  # Thread safety for pymodbus
+        # Guards connection state only (connect/close/reconnect). Requests go
+        # out unlocked - pymodbus matches responses to them by transaction ID
+        self._lock = asyncio.Lock()
         self._connected = False
+        self._consecutive_errors = 0  # Request errors since the last success
+        self._error_streak = False  # An error has been logged since the last success
+        # In-flight reads keyed by (address, count) so identical concurrent
+        # requests share one round-trip
+        self._pending_reads: dict[tuple[int, int], asyncio.Task[list[int] | None]] = {}
+        # Last known value of every register read or written, with the loop
+        # time it was seen - lets slow-changing registers be served locally
+        self._cache: dict[int, tuple[int, float]] = {}
+        # Single-register writes waiting to go out, one per address, and the
+        # task writing each address. A newer value for an address replaces the
+        # queued one - only the latest is sent, and the replaced caller's future
+        # resolves to None so it can be told its value never went out
+        self._queued_writes: dict[int, tuple[int, asyncio.Future[bool | None]]] = {}
+        self._writers: dict[int, asyncio.Task[None]] = {}
 
     async def connect(self) -> bool:
         """
@@ -73,6 +192,10 @@ class AsyncModbusClient:
 
         Returns:
             True if connection successful, False otherwise
+
+        Raises:
+            ModbusException: The client rejected its configuration
+            ValueError: The host, port or slave address is invalid
         """
         async with self._lock:
             return await self._connect_unlocked()
@@ -81,10 +204,16 @@ class AsyncModbusClient:
         """
         Internal connection method that doesn't acquire the lock.
 
-        Must be called while holding the lock.
+        Must be called while holding the lock. Network failures are logged and
+        reported as False so the caller can retry; configuration errors are
+        raised, since retrying them can never succeed.
 
         Returns:
             True if connection successful, False otherwise
+
+        Raises:
+            ModbusException: The client rejected its configuration
+            ValueError: The host, port or slave address is invalid
         """
         try:
             if self._client is None:
@@ -92,12 +221,19 @@ class AsyncModbusClient:
                     host=self.host,
                     port=self.port,
                     timeout=self.timeout,
+                    reconnect_delay=RECONNECT_DELAY,
+                    reconnect_delay_max=RECONNECT_DELAY_MAX,
+                    # Every request is already bounded by asyncio.timeout(self.timeout);
+                    # internal retries could never run inside that window and
+                    # would only be cancelled mid-transaction
+                    retries=0,
                 )
 
             if not self._connected:
                 # Add timeout to connect (Critical fix #3)
                 try:
-                    await asyncio.wait_for(self._client.connect(), timeout=float(self.timeout))
+                    async with asyncio.timeout(self.timeout):
+                        await self._client.connect()
                 except TimeoutError:
                     _LOGGER.error(
                         "Connection to %s:%s timed out after %ss",
@@ -110,6 +246,7 @@ class AsyncModbusClient:
                 self._connected = self._client.connected
 
                 if self._connected:
+                    self._configure_socket()
                     _LOGGER.info(
                         "Connected to Modbus device at %s:%s (slave %s)",
                         self.host,
@@ -125,6 +262,20 @@ class AsyncModbusClient:
 
             return self._connected
 
+        except (ConnectionException, OSError) as err:
+            _LOGGER.error(
+                "Error connecting to Modbus device at %s:%s: %s",
+                self.host,
+                self.port,
+                err,
+            )
+            self._connected = False
+            return False
+        except (ModbusException, ValueError):
+            # Configuration problem - let the caller tell it apart from a
+            # network failure instead of retrying it forever
+            self._connected = False
+            raise
         except Exception as err:
             _LOGGER.error(
                 "Error connecting to Modbus device at %s:%s: %s",
@@ -135,8 +286,38 @@ class AsyncModbusClient:
             self._connected = False
             return False
 
+    def _configure_socket(self) -> None:
+        """
+        Apply low-latency and keep-alive options to the connected socket.
+
+        TCP_NODELAY stops Nagle's algorithm from holding back our small
+        request frames, and SO_KEEPALIVE lets the kernel notice a dead peer
+        between polls. Best effort: the transport is a pymodbus internal, so
+        if it cannot be reached the connection is used with default options.
+        """
+        transport = getattr(getattr(self._client, "ctx", None), "transport", None)
+        sock = (
+            transport.get_extra_info("socket")
+            if isinstance(transport, asyncio.BaseTransport)
+            else None
+        )
+        if sock is None:
+            _LOGGER.debug("Modbus socket not accessible, keeping default socket options")
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError as err:
+            _LOGGER.debug("Could not set Modbus socket options: %s", err)
+
     async def disconnect(self) -> None:
         """Close the Modbus connection."""
+        # Queued writes must not reconnect behind our back once we're closed
+        if writers := list(self._writers.values()):
+            for task in writers:
+                task.cancel()
+            await asyncio.gather(*writers, return_exceptions=True)
+
         async with self._lock:
             if self._client is not None:
                 try:
@@ -159,10 +340,14 @@ class AsyncModbusClient:
 
     def _reset_connection(self) -> None:
         """
-        Reset connection state and close client (High fix #1).
-
-        Call this when errors occur to ensure stale client is cleaned up.
-        Must be called while holding the lock.
+        Reset connection state and close the socket (High fix #1).
+
+        Called on timeouts and once errors keep recurring (see _record_error)
+        to ensure the stale socket is cleaned up. The pymodbus client object
+        itself is kept and reconnected lazily on the next operation, so this
+        costs one reconnect rather than a new client. Only disconnect()
+        discards the client.
+        Safe to call without the lock - it never awaits.
         """
         if self._client is not None:
             try:
@@ -170,26 +355,79 @@ class AsyncModbusClient:
             except Exception as err:
                 _LOGGER.debug("Error closing client during reset: %s", err)
         self._connected = False
-        self._client = None
+
+    def _log_error(self, msg: str, *args: object) -> None:
+        """
+        Log a request failure at ERROR only if it starts a run of failures.
+
+        During an outage every poll fails the same way; the first failure is
+        reported and the rest go to DEBUG until a request succeeds again.
+        """
+        if self._error_streak:
+            _LOGGER.debug(msg, *args)
+        else:
+            self._error_streak = True
+            _LOGGER.error(msg, *args)
+
+    def _clear_errors(self) -> None:
+        """Reset error tracking after a successful request."""
+        self._consecutive_errors = 0
+        if self._error_streak:
+            self._error_streak = False
+            _LOGGER.info("Modbus communication with %s:%s restored", self.host, self.port)
+
+    def _record_error(self) -> None:
+        """
+        Count a failed request, resetting the connection if failures persist.
+
+        A single error response or exception usually doesn't mean the socket
+        is bad, and tearing it down each time causes reconnect storms on a
+        flaky bridge. Timeouts still reset straight away, since a late reply
+        could otherwise be read as the answer to the next request.
+        """
+        self._consecutive_errors += 1
+        if self._consecutive_errors >= ERROR_RESET_THRESHOLD:
+            _LOGGER.warning(
+                "%d consecutive Modbus errors, resetting connection to %s:%s",
+                self._consecutive_errors,
+                self.host,
+                self.port,
+            )
+            self._consecutive_errors = 0
+            self._reset_connection()
 
     async def _ensure_connected(self) -> bool:
         """
         Ensure the client is connected, attempting reconnection if needed.
 
-        Must be called while holding the lock (called from read/write methods).
+        Connected callers return without touching the lock. Otherwise the
+        first caller reconnects under the lock and any others queued behind
+        it find the connection already up.
 
         Returns:
             True if connected, False otherwise
         """
-        if not self.is_connected:
+        # Fast path - runs before every request, so check the fields directly.
+        # The device may drop the socket between polls; trust pymodbus's view of
+        # the transport over our own flag so we reconnect before the request
+        client = self._client
+        if self._connected and client is not None:
+            if client.connected:
+                return True
+            _LOGGER.debug("Modbus socket was closed, marking connection stale")
+            self._connected = False
+
+        async with self._lock:
+            if self.is_connected:
+                return True
             _LOGGER.debug("Not connected, attempting to reconnect...")
             return await self._connect_unlocked()
-        return True
 
     async def read_register(
         self,
         address: int,
         count: int = 1,
+        max_age: float = 0.0,
     ) -> list[int] | None:
         """
         Read holding register(s) from the Modbus device.
@@ -197,65 +435,129 @@ class AsyncModbusClient:
         Args:
             address: Register address (e.g., 0x0102 for SOC)
             count: Number of consecutive registers to read (default: 1)
+            max_age: Serve the values from the cache if every register in the
+                range was read or written less than this many seconds ago
+                (default: 0, always ask the device)
 
         Returns:
             List of register values (unsigned 16-bit integers), or None on error
         """
-        async with self._lock:
-            try:
-                # Ensure we're connected
-                if not await self._ensure_connected():
-                    return None
-
-                # Read holding registers with timeout (Critical fix #3)
-                try:
-                    result = await asyncio.wait_for(
-                        self._client.read_holding_registers(
-                            address=address,
-                            count=count,
-                            device_id=self.slave_address,
-                        ),
-                        timeout=float(self.timeout),
-                    )
-                except TimeoutError:
-                    _LOGGER.error(
-                        "Modbus read at address 0x%04X timed out after %ss",
-                        address,
-                        self.timeout,
-                    )
-                    self._reset_connection()
-                    return None
+        if max_age > 0 and (cached := self._cached_registers(address, count, max_age)):
+            return cached
+
+        key = (address, count)
+        task = self._pending_reads.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._read_holding_registers(address, count)
+            )
+            self._pending_reads[key] = task
+            task.add_done_callback(lambda _: self._pending_reads.pop(key, None))
+        else:
+            _LOGGER.debug("Joining in-flight read at address 0x%04X", address)
 
-                # Check for errors
-                if result.isError():
-                    _LOGGER.error(
-                        "Modbus read error at address 0x%04X: %s",
-                        address,
-                        result,
-                    )
-                    # Reset connection to trigger reconnect on next operation
-                    self._reset_connection()
-                    return None
+        # Shielded so one cancelled caller doesn't abort the read for the others
+        registers = await asyncio.shield(task)
+        return None if registers is None else list(registers)
 
-                return result.registers
+    async def _read_holding_registers(self, address: int, count: int) -> list[int] | None:
+        """Issue a holding register read, reconnecting first if needed."""
+        try:
+            # Ensure we're connected
+            if not await self._ensure_connected():
+                return None
 
-            except ModbusException as err:
-                _LOGGER.error(
-                    "Modbus exception reading address 0x%04X: %s",
+            # Read holding registers with timeout (Critical fix #3)
+            try:
+                async with asyncio.timeout(self.timeout):
+                    result = await self._client.read_holding_registers(
+                        address=address,
+                        count=count,
+                        device_id=self.slave_address,
+                    )
+            except TimeoutError:
+                self._log_error(
+                    "Modbus read at address 0x%04X timed out after %ss",
                     address,
-                    err,
+                    self.timeout,
                 )
                 self._reset_connection()
                 return None
-            except Exception as err:
-                _LOGGER.error(
-                    "Unexpected error reading address 0x%04X: %s",
+
+            # Check for errors
+            if result.isError():
+                self._log_error(
+                    "Modbus read error at address 0x%04X: %s",
                     address,
-                    err,
+                    result,
                 )
-                self._reset_connection()
+                # The device answered, so the link is up - only count it
+                self._record_error()
                 return None
 
+            registers = result.registers
+            self._clear_errors()
+            self._store_cache(address, registers)
+            return registers
+
+        except ModbusException as err:
+            self._log_error(
+                "Modbus exception reading address 0x%04X: %s",
+                address,
+                err,
+            )
+            self._record_error()
+            return None
+        except Exception as err:
+            self._log_error(
+                "Unexpected error reading address 0x%04X: %s",
+                address,
+                err,
+            )
+            self._record_error()
+            return None
+
+    async def read_device_registers(
+        self, device_id: int, address: int, count: int = 1
+    ) -> list[int] | None:
+        """
+        Read holding registers from another device behind the same gateway.
+
+        Uses this client's connection, so a second slave on the same host:port
+        can be queried without opening another socket. The result is not
+        cached and does not count towards this client's error tracking.
+
+        Args:
+            device_id: Modbus slave address to query
+            address: Register address
+            count: Number of consecutive registers to read (default: 1)
+
+        Returns:
+            List of register values, or None if the device rejected the request
+
+        Raises:
+            ConnectionException: The gateway could not be reached or timed out
+        """
+        if not await self._ensure_connected() or (client := self._client) is None:
+            raise ConnectionException(f"Not connected to {self.host}:{self.port}")
+
+        try:
+            async with asyncio.timeout(self.timeout):
+                result = await client.read_holding_registers(
+                    address=address,
+                    count=count,
+                    device_id=device_id,
+                )
+        except TimeoutError:
+            raise ConnectionException(
+                f"Read from device {device_id} at {self.host}:{self.port} timed out"
+            ) from None
+
+        if result.isError():
+            return None
+        registers: list[int] = result.registers
+        return registers
+
     async def write_register(
         self,
         address: int,
@@ -264,76 +566,279 @@ class AsyncModbusClient:
         """
         Write a single holding register to the Modbus device.
 
+        Writes to the same address go out one at a time. If several arrive
+        while one is on the wire, only the most recent value is written next.
+        Callers asking for that same value share its result.
+
         Args:
             address: Register address
             value: Value to write (0-65535, unsigned 16-bit)
 
         Returns:
             True on success, False on error
+
+        Raises:
+            WriteSupersededError: A newer value for the address was queued
+                before this one was sent, so this value never reached the device
         """
-        async with self._lock:
-            try:
-                # Ensure we're connected
-                if not await self._ensure_connected():
-                    return False
+        queued = self._queued_writes.get(address)
+        if queued is not None and queued[0] == value:
+            # Same value already waiting to go out - share its outcome
+            future = queued[1]
+        else:
+            if queued is not None:
+                # Not sent yet and now never will be
+                _LOGGER.debug(
+                    "Superseding queued write of %s to address 0x%04X with %s",
+                    queued[0],
+                    address,
+                    value,
+                )
+                if not queued[1].done():
+                    queued[1].set_result(None)
+            future = asyncio.get_running_loop().create_future()
+            self._queued_writes[address] = (value, future)
+
+        if address not in self._writers:
+            self._writers[address] = asyncio.get_running_loop().create_task(
+                self._drain_writes(address)
+            )
 
-                # Write single register with timeout (Critical fix #3)
-                try:
-                    result = await asyncio.wait_for(
-                        self._client.write_register(
-                            address=address,
-                            value=value,
-                            device_id=self.slave_address,
-                        ),
-                        timeout=float(self.timeout),
-                    )
-                except TimeoutError:
-                    _LOGGER.error(
-                        "Modbus write at address 0x%04X timed out after %ss",
-                        address,
-                        self.timeout,
-                    )
-                    self._reset_connection()
-                    return False
+        # Shielded so one cancelled caller doesn't cancel the write for the others
+        success = await asyncio.shield(future)
+        if success is None:
+            raise WriteSupersededError(
+                f"Write of {value} to address 0x{address:04X} superseded by a newer value"
+            )
+        return success
 
-                # Check for errors
-                if result.isError():
-                    _LOGGER.error(
-                        "Modbus write error at address 0x%04X (value=%s): %s",
-                        address,
-                        value,
-                        result,
-                    )
-                    # Reset connection to trigger reconnect on next operation
-                    self._reset_connection()
-                    return False
+    async def _drain_writes(self, address: int) -> None:
+        """Send queued writes for one address until none are left."""
+        future: asyncio.Future[bool | None] | None = None
+        try:
+            while (queued := self._queued_writes.pop(address, None)) is not None:
+                value, future = queued
+                success = await self._write_register_now(address, value)
+                if not future.done():
+                    future.set_result(success)
+        except asyncio.CancelledError:
+            # Fail the write in progress and anything still queued behind it
+            if future is not None:
+                future.cancel()
+            if (queued := self._queued_writes.pop(address, None)) is not None:
+                queued[1].cancel()
+            raise
+        finally:
+            self._writers.pop(address, None)
+
+    async def _write_register_now(self, address: int, value: int) -> bool:
+        """Issue a single register write, reconnecting first if needed."""
+        try:
+            # Ensure we're connected
+            if not await self._ensure_connected():
+                return False
 
-                _LOGGER.debug(
-                    "Successfully wrote value %s to address 0x%04X",
-                    value,
+            # Write single register with timeout (Critical fix #3)
+            try:
+                async with asyncio.timeout(self.timeout):
+                    result = await self._client.write_register(
+                        address=address,
+                        value=value,
+                        device_id=self.slave_address,
+                    )
+            except TimeoutError:
+                self._log_error(
+                    "Modbus write at address 0x%04X timed out after %ss",
                     address,
+                    self.timeout,
                 )
-                return True
+                self._reset_connection()
+                return False
 
-            except ModbusException as err:
-                _LOGGER.error(
-                    "Modbus exception writing address 0x%04X (value=%s): %s",
+            # Check for errors
+            if result.isError():
+                self._log_error(
+                    "Modbus write error at address 0x%04X (value=%s): %s",
                     address,
                     value,
-                    err,
+                    result,
                 )
-                self._reset_connection()
+                # The device answered, so the link is up - only count it
+                self._record_error()
                 return False
-            except Exception as err:
-                _LOGGER.error(
-                    "Unexpected error writing address 0x%04X (value=%s): %s",
+
+            _LOGGER.debug(
+                "Successfully wrote value %s to address 0x%04X",
+                value,
+                address,
+            )
+            self._clear_errors()
+            self._store_cache(address, (value,))
+            return True
+
+        except ModbusException as err:
+            self._log_error(
+                "Modbus exception writing address 0x%04X (value=%s): %s",
+                address,
+                value,
+                err,
+            )
+            self._record_error()
+            return False
+        except Exception as err:
+            self._log_error(
+                "Unexpected error writing address 0x%04X (value=%s): %s",
+                address,
+                value,
+                err,
+            )
+            self._record_error()
+            return False
+
+    async def write_registers(
+        self,
+        address: int,
+        values: list[int],
+    ) -> bool:
+        """
+        Write consecutive holding registers in a single request (FC16).
+
+        Multi-word values go out in one round trip, so the device never
+        sees a half-written value between two separate single-register writes.
+
+        Args:
+            address: First register address
+            values: Values to write (each 0-65535, unsigned 16-bit)
+
+        Returns:
+            True on success, False on error
+        """
+        try:
+            # Ensure we're connected
+            if not await self._ensure_connected():
+                return False
+
+            try:
+                async with asyncio.timeout(self.timeout):
+                    result = await self._client.write_registers(
+                        address=address,
+                        values=values,
+                        device_id=self.slave_address,
+                    )
+            except TimeoutError:
+                self._log_error(
+                    "Modbus write at address 0x%04X timed out after %ss",
                     address,
-                    value,
-                    err,
+                    self.timeout,
                 )
                 self._reset_connection()
                 return False
 
+            # Check for errors
+            if result.isError():
+                self._log_error(
+                    "Modbus write error at address 0x%04X (values=%s): %s",
+                    address,
+                    values,
+                    result,
+                )
+                # The device answered, so the link is up - only count it
+                self._record_error()
+                return False
+
+            _LOGGER.debug(
+                "Successfully wrote values %s to address 0x%04X",
+                values,
+                address,
+            )
+            self._clear_errors()
+            self._store_cache(address, values)
+            return True
+
+        except ModbusException as err:
+            self._log_error(
+                "Modbus exception writing address 0x%04X (values=%s): %s",
+                address,
+                values,
+                err,
+            )
+            self._record_error()
+            return False
+        except Exception as err:
+            self._log_error(
+                "Unexpected error writing address 0x%04X (values=%s): %s",
+                address,
+                values,
+                err,
+            )
+            self._record_error()
+            return False
+
+    def _store_cache(self, address: int, values: Sequence[int]) -> None:
+        """Record register values confirmed by a successful read or write."""
+        now = asyncio.get_running_loop().time()
+        cache = self._cache
+        for offset, value in enumerate(values):
+            cache[address + offset] = (value, now)
+
+    def _cached_registers(self, address: int, count: int, max_age: float) -> list[int] | None:
+        """Return the cached range if every register in it is fresh, else None."""
+        cache = self._cache
+        oldest = asyncio.get_running_loop().time() - max_age
+        registers = []
+        for reg in range(address, address + count):
+            entry = cache.get(reg)
+            if entry is None or entry[1] <= oldest:
+                return None
+            registers.append(entry[0])
+        return registers
+
+    async def read_cached(self, address: int, max_age: float) -> int | None:
+        """
+        Return a single register, from the cache if it was seen recently enough.
+
+        Intended for configuration registers that only change on user action,
+        so callers can poll them at a fraction of the telemetry rate.
+
+        Args:
+            address: Register address
+            max_age: Maximum age in seconds of a cached value that may be returned
+
+        Returns:
+            Raw register value (unsigned 16-bit integer), or None on error
+        """
+        registers = await self.read_register(address, max_age=max_age)
+        if registers:
+            return registers[0]
+        return None
+
+    async def read_block(self, address: int, count: int) -> list[int] | None:
+        """
+        Read a contiguous block of holding registers in a single request.
+
+        Callers that need several nearby registers should read the whole
+        window once and slice locally rather than issuing one request each.
+
+        Args:
+            address: First register address of the block
+            count: Number of consecutive registers to read
+
+        Returns:
+            List of exactly `count` register values, or None on error
+        """
+        registers = await self.read_register(address, count=count)
+        if registers is None:
+            return None
+        if len(registers) < count:
+            _LOGGER.error(
+                "Short Modbus read at address 0x%04X: expected %d registers, got %d",
+                address,
+                count,
+                len(registers),
+            )
+            return None
+        return registers
+
     async def read_register_single(self, address: int) -> int | None:
         """
         Read a single holding register and return its raw value.
@@ -353,7 +858,8 @@ class AsyncModbusClient:
         """
         Read a 32-bit value from two consecutive registers.
 
-        The value is constructed as: (register[0] << 16) | register[1]
+        The value is constructed as: (register[0] << 16) | register[1],
+        i.e. the two words decoded as one big-endian unsigned int.
 
         Args:
             address: Starting register address
@@ -364,7 +870,8 @@ class AsyncModbusClient:
         registers = await self.read_register(address, count=2)
         if registers and len(registers) == 2:
             # Combine two 16-bit registers into 32-bit value
-            return (registers[0] << 16) | registers[1]
+            value: int = _U32_BE.unpack(_U16X2_BE.pack(registers[0], registers[1]))[0]
+            return value
         return None
 
     async def write_register_32bit(self, address: int, value: int, max_retries: int = 2) -> bool:
@@ -372,11 +879,14 @@ class AsyncModbusClient:
         Write a 32-bit value to two consecutive registers.
 
         The value is split as: register[0] = (value >> 16), register[1] = (value & 0xFFFF)
+        and both words are sent in a single FC16 request, so a failure can no
+        longer leave the device holding only the high word. Failed attempts are
+        retried with exponential backoff.
 
         Args:
             address: Starting register address
             value: 32-bit unsigned integer value to write
-            max_retries: Number of retries on partial failure
+            max_retries: Number of retries on failure
 
         Returns:
             True on success, False on error
@@ -387,49 +897,79 @@ class AsyncModbusClient:
             return False
 
         # Split 32-bit value into two 16-bit registers
-        high_word = (value >> 16) & 0xFFFF
-        low_word = value & 0xFFFF
+        words = list(_U16X2_BE.unpack(_U32_BE.pack(value)))
 
         for attempt in range(max_retries + 1):
-            # Write high word first
-            success_high = await self.write_register(address, high_word)
-            if not success_high:
-                _LOGGER.error(
-                    "Failed to write high word of 32-bit value at 0x%04X (attempt %d/%d)",
-                    address,
-                    attempt + 1,
-                    max_retries + 1,
-                )
-                continue  # Retry the whole operation
-
-            # Write low word
-            success_low = await self.write_register(address + 1, low_word)
-            if not success_low:
-                _LOGGER.error(
-                    "Failed to write low word of 32-bit value at 0x%04X (attempt %d/%d)",
-                    address + 1,
-                    attempt + 1,
-                    max_retries + 1,
+            if await self.write_registers(address, words):
+                return True
+            _LOGGER.error(
+                "Failed to write 32-bit value at 0x%04X (attempt %d/%d)",
+                address,
+                attempt + 1,
+                max_retries + 1,
+            )
+            if attempt < max_retries:
+                # Give a struggling device a moment before trying again
+                await asyncio.sleep(
+                    min(WRITE_RETRY_BASE_DELAY * (2**attempt), WRITE_RETRY_MAX_DELAY)
                 )
-                # Critical fix #3: Attempt recovery by re-writing high word
-                # This ensures the device gets a consistent value on retry
-                if attempt < max_retries:
-                    _LOGGER.warning("Partial 32-bit write detected, will retry entire operation")
-                    continue
-                else:
-                    _LOGGER.error(
-                        "Partial 32-bit write failure at 0x%04X after %d attempts - "
-                        "device may be in inconsistent state",
-                        address,
-                        max_retries + 1,
-                    )
-                    return False
-
-            # Both writes succeeded
-            return True
 
         return False
 
+    async def read_battery_block(self) -> BatteryReadings | None:
+        """
+        Read all battery telemetry with as few requests as possible.
+
+        Voltage, current, SOC and status are contiguous and come back in one
+        request; power sits well outside that window and takes a second one.
+
+        Returns:
+            BatteryReadings, or None if either read fails
+        """
+        block = await self.read_block(BATTERY_BLOCK_START, BATTERY_BLOCK_COUNT)
+        if block is None:
+            return None
+        power = await self.read_register_single(REG_BATTERY_POWER)
+        if power is None:
+            return None
+
+        # Every field is decoded by address through the scale table
+        start = BATTERY_BLOCK_START
+        return BatteryReadings(
+            voltage=_decode(REG_BATTERY_VOLTAGE, block[REG_BATTERY_VOLTAGE - start]),
+            current=_decode(REG_BATTERY_CURRENT, block[REG_BATTERY_CURRENT - start]),
+            soc=_decode(REG_BATTERY_SOC, block[REG_BATTERY_SOC - start]),
+            status=block[REG_BATTERY_STATUS - start],
+            power=_decode_int(REG_BATTERY_POWER, power),
+        )
+
+    async def read_config_block(self) -> ConfigReadings | None:
+        """
+        Read the configuration registers (0x0800-0x0805) in a single request.
+
+        Returns:
+            ConfigReadings, or None on error
+        """
+        block = await self.read_block(CONFIG_BLOCK_START, CONFIG_BLOCK_COUNT)
+        if block is None:
+            return None
+
+        max_feed_grid_pct, pv_capacity_storage, system_mode = _CONFIG_FIELDS.unpack(
+            _CONFIG_WORDS.pack(*block)
+        )
+        return ConfigReadings(
+            max_feed_grid_pct=max_feed_grid_pct,
+            pv_capacity_storage=pv_capacity_storage,
+            system_mode=system_mode,
+        )
+
+    async def _read_scaled(self, address: int) -> float | None:
+        """Read one register from _REGISTER_SCALES and decode it, or None on error."""
+        value = await self.read_register_single(address)
+        if value is None:
+            return None
+        return _decode(address, value)
+
     async def read_soc(self) -> float | None:
         """
         Read battery State of Charge.
@@ -437,10 +977,7 @@ class AsyncModbusClient:
         Returns:
             SOC as percentage (0.0-100.0), or None on error
         """
-        value = await self.read_register_single(REG_BATTERY_SOC)
-        if value is not None:
-            return value / 10.0  # Scale factor 0.1
-        return None
+        return await self._read_scaled(REG_BATTERY_SOC)
 
     async def read_voltage(self) -> float | None:
         """
@@ -449,10 +986,7 @@ class AsyncModbusClient:
         Returns:
             Voltage in volts, or None on error
         """
-        value = await self.read_register_single(REG_BATTERY_VOLTAGE)
-        if value is not None:
-            return value / 10.0  # Scale factor 0.1
-        return None
+        return await self._read_scaled(REG_BATTERY_VOLTAGE)
 
     async def read_current(self) -> float | None:
         """
@@ -461,13 +995,7 @@ class AsyncModbusClient:
         Returns:
             Current in amps (positive=discharge, negative=charge), or None on error
         """
-        value = await self.read_register_single(REG_BATTERY_CURRENT)
-        if value is not None:
-            # Convert to signed 16-bit
-            if value > 32767:
-                value -= 65536
-            return value / 10.0  # Scale factor 0.1
-        return None
+        return await self._read_scaled(REG_BATTERY_CURRENT)
 
     async def read_power(self) -> int | None:
         """
@@ -477,12 +1005,9 @@ class AsyncModbusClient:
             Power in watts (positive=discharge, negative=charge), or None on error
         """
         value = await self.read_register_single(REG_BATTERY_POWER)
-        if value is not None:
-            # Convert to signed 16-bit
-            if value > 32767:
-                value -= 65536
-            return value
-        return None
+        if value is None:
+            return None
+        return _decode_int(REG_BATTERY_POWER, value)
 
     async def read_max_feed_grid_pct(self) -> int | None:
         """
@@ -502,6 +1027,9 @@ class AsyncModbusClient:
 
         Returns:
             True on success, False on error
+
+        Raises:
+            WriteSupersededError: A newer value was queued before this one was sent
         """
         if not 0 <= percentage <= 100:
             _LOGGER.error("Invalid percentage value: %s (must be 0-100)", percentage)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
@@ -61,6 +60,8 @@ class BytewattManualLimitNumber(CoordinatorEntity, NumberEntity):
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_manual_limit"
         self._attr_name = "Manual Export Limit"
+        # Shared dict built once by the coordinator
+        self._attr_device_info = coordinator.device_info
 
     @property
     def available(self) -> bool:
@@ -74,7 +75,7 @@ class BytewattManualLimitNumber(CoordinatorEntity, NumberEntity):
             # Medium fix #9: Standardize logging to DEBUG
             _LOGGER.debug("Coordinator data is None, cannot get manual limit")
             return None
-        return self.coordinator.data.get("our_limit")
+        return self.coordinator.data.our_limit
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the manual export limit."""
@@ -88,8 +89,3 @@ class BytewattManualLimitNumber(CoordinatorEntity, NumberEntity):
         except Exception as err:
             _LOGGER.exception("Error setting export limit: %s", err)
             raise HomeAssistantError(f"Error setting export limit: {err}") from err
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return self.coordinator.device_info
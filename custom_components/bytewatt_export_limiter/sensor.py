@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -17,11 +20,56 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN  # Still needed for hass.data lookup
-from .coordinator import BytewattCoordinator
+from .coordinator import BytewattCoordinator, BytewattCoordinatorData
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class BytewattSensorEntityDescription(SensorEntityDescription):
+    """Sensor description with the coordinator field it reports."""
+
+    value_fn: Callable[[BytewattCoordinatorData], Any]
+
+
+# The key doubles as the unique_id suffix, so it must never change for an
+# existing sensor
+SENSORS: tuple[BytewattSensorEntityDescription, ...] = (
+    BytewattSensorEntityDescription(
+        key="export_limit",
+        name="Export Limit",
+        icon="mdi:transmission-tower-export",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        suggested_display_precision=0,  # Low fix #15: Watts are integers
+        value_fn=lambda data: data.export_limit,
+    ),
+    # SAPN (grid operator) imposed export limit
+    BytewattSensorEntityDescription(
+        key="sapn_limit",
+        name="SAPN Limit",
+        icon="mdi:transmission-tower",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        suggested_display_precision=0,
+        value_fn=lambda data: data.their_limit,
+    ),
+    # Mirrored electricity price from the monitored entity
+    BytewattSensorEntityDescription(
+        key="current_price",
+        name="Current Price",
+        # Low fix #14: Use generic currency icon instead of USD-specific
+        icon="mdi:currency-sign",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="$/kWh",
+        suggested_display_precision=2,
+        value_fn=lambda data: data.current_price,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -35,34 +83,27 @@ async def async_setup_entry(
 
     coordinator: BytewattCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    sensors = [
-        BytewattExportLimitSensor(coordinator, entry),
-        BytewattSAPNLimitSensor(coordinator, entry),
-        BytewattCurrentPriceSensor(coordinator, entry),
-    ]
-
-    async_add_entities(sensors)
+    async_add_entities(BytewattSensor(coordinator, entry, description) for description in SENSORS)
 
 
-class BytewattExportLimitSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for current export limit in watts."""
+class BytewattSensor(CoordinatorEntity, SensorEntity):
+    """Sensor reporting one field of the coordinator data."""
 
     _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-    _attr_suggested_display_precision = 0  # Low fix #15: Watts are integers
-    _attr_icon = "mdi:transmission-tower-export"
+    entity_description: BytewattSensorEntityDescription
 
     def __init__(
         self,
         coordinator: BytewattCoordinator,
         entry: ConfigEntry,
+        description: BytewattSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_export_limit"
-        self._attr_name = "Export Limit"
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        # Shared dict built once by the coordinator
+        self._attr_device_info = coordinator.device_info
 
     @property
     def available(self) -> bool:
@@ -70,91 +111,10 @@ class BytewattExportLimitSensor(CoordinatorEntity, SensorEntity):
         return self.coordinator.last_update_success
 
     @property
-    def native_value(self) -> int | None:
-        """Return the current export limit in watts."""
-        if self.coordinator.data is None:
-            _LOGGER.debug("Coordinator data is None for export_limit sensor")
-            return None
-        return self.coordinator.data.get("export_limit")
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return self.coordinator.device_info
-
-
-class BytewattSAPNLimitSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for SAPN (grid operator) imposed export limit in watts."""
-
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-    _attr_suggested_display_precision = 0
-    _attr_icon = "mdi:transmission-tower"
-
-    def __init__(
-        self,
-        coordinator: BytewattCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_sapn_limit"
-        self._attr_name = "SAPN Limit"
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the SAPN (grid) imposed limit in watts."""
-        if self.coordinator.data is None:
+    def native_value(self) -> Any:
+        """Return the sensor's value from the latest coordinator data."""
+        data = self.coordinator.data
+        if data is None:
+            _LOGGER.debug("Coordinator data is None for %s sensor", self.entity_description.key)
             return None
-        return self.coordinator.data.get("their_limit")
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return self.coordinator.device_info
-
-
-class BytewattCurrentPriceSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for mirrored electricity price from monitored entity."""
-
-    _attr_has_entity_name = True
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "$/kWh"
-    _attr_suggested_display_precision = 2
-    # Low fix #14: Use generic currency icon instead of USD-specific
-    _attr_icon = "mdi:currency-sign"
-
-    def __init__(
-        self,
-        coordinator: BytewattCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_current_price"
-        self._attr_name = "Current Price"
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available (High fix #4)."""
-        return self.coordinator.last_update_success
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current electricity price in $/kWh."""
-        if self.coordinator.data is None:
-            _LOGGER.debug("Coordinator data is None for current_price sensor")
-            return None
-        return self.coordinator.data.get("current_price")
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return self.coordinator.device_info
+        return self.entity_description.value_fn(data)
@@ -7,7 +7,7 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -53,41 +53,73 @@ class BytewattAutomationSwitch(CoordinatorEntity, SwitchEntity):
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_automation_enabled"
         self._attr_name = "Automation Enabled"
+        # Shared dict built once by the coordinator
+        self._attr_device_info = coordinator.device_info
+        self._update_from_data()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available (High fix #4)."""
-        return self.coordinator.last_update_success
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if automation is enabled."""
-        if self.coordinator.data is None:
+        # Cached on each coordinator update rather than read through per access
+        return self._attr_available
+
+    def _update_from_data(self) -> None:
+        """Cache availability and the automation state from the coordinator."""
+        self._attr_available = self.coordinator.last_update_success
+        data = self.coordinator.data
+        if data is None:
             # Medium fix #9: Standardize logging to DEBUG
-            _LOGGER.debug("Coordinator data is None, cannot get automation state")
-            return None
-        # High fix #7: Don't use False as default - return None if key missing
-        return self.coordinator.data.get("automation_enabled")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Coordinator data is None, cannot get automation state")
+            self._attr_is_on = None
+        else:
+            self._attr_is_on = data.automation_enabled
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """
+        Refresh the cached state when the coordinator publishes new data.
+
+        The snapshot also changes with the price and limits, which this switch
+        doesn't show - only write state when the switch or its availability
+        actually changed.
+        """
+        previous = (self._attr_is_on, self._attr_available)
+        self._update_from_data()
+        if (self._attr_is_on, self._attr_available) == previous:
+            return
+        super()._handle_coordinator_update()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on automation."""
-        _LOGGER.debug("Enabling price-based automation")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Enabling price-based automation")
+        # Show the new state straight away rather than after the coordinator
+        # round trip, and put the previous state back if the change fails
+        previous = self._attr_is_on
+        self._attr_is_on = True
+        self.async_write_ha_state()
         try:
             await self.coordinator.set_automation_enabled(True)
         except Exception as err:
+            self._attr_is_on = previous
+            self.async_write_ha_state()
             _LOGGER.exception("Error enabling automation: %s", err)
             raise HomeAssistantError(f"Error enabling automation: {err}") from err
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off automation."""
-        _LOGGER.debug("Disabling price-based automation")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Disabling price-based automation")
+        # Show the new state straight away rather than after the coordinator
+        # round trip, and put the previous state back if the change fails
+        previous = self._attr_is_on
+        self._attr_is_on = False
+        self.async_write_ha_state()
         try:
             await self.coordinator.set_automation_enabled(False)
         except Exception as err:
+            self._attr_is_on = previous
+            self.async_write_ha_state()
             _LOGGER.exception("Error disabling automation: %s", err)
             raise HomeAssistantError(f"Error disabling automation: {err}") from err
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return self.coordinator.device_info
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Generator
+import struct
+from collections.abc import Generator, Mapping
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -23,6 +26,12 @@ from custom_components.bytewatt_export_limiter.const import (
     DEFAULT_SLAVE,
     DOMAIN,
 )
+from custom_components.bytewatt_export_limiter.coordinator import BytewattCoordinatorData
+
+# Same word layout the client uses: one big-endian 32-bit value as two
+# big-endian 16-bit registers
+_U32_BE = struct.Struct(">I")
+_U16X2_BE = struct.Struct(">HH")
 
 
 @pytest.fixture
@@ -50,33 +59,40 @@ def mock_modbus_response() -> MagicMock:
     return response
 
 
-@pytest.fixture
-def modbus_client_config() -> dict[str, Any]:
+# Pure-data fixtures are built once per session and handed out read-only, so
+# a test can't leak changes into the next one. Tests that need different
+# values should build their own mapping.
+@pytest.fixture(scope="session")
+def modbus_client_config() -> Mapping[str, Any]:
     """Return default Modbus client configuration."""
-    return {
-        "host": "192.168.1.100",
-        "port": DEFAULT_PORT,
-        "slave_address": DEFAULT_SLAVE,
-        "timeout": 10,
-    }
-
-
-@pytest.fixture
-def config_entry_data() -> dict[str, Any]:
-    """Return default config entry data."""
-    return {
-        CONF_MODBUS_HOST: "192.168.1.100",
-        CONF_MODBUS_PORT: DEFAULT_PORT,
-        CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
-        CONF_PRICE_ENTITY: "sensor.electricity_price",
-        CONF_PRICE_THRESHOLD: 0.05,
-        CONF_CURTAILED_LIMIT: DEFAULT_CURTAILED_LIMIT,
-        CONF_POLL_INTERVAL: DEFAULT_POLL_INTERVAL,
-    }
+    return MappingProxyType(
+        {
+            "host": "192.168.1.100",
+            "port": DEFAULT_PORT,
+            "slave_address": DEFAULT_SLAVE,
+            "timeout": 10,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def config_entry_data() -> Mapping[str, Any]:
+    """Return default config entry data (read-only, like ConfigEntry.data)."""
+    return MappingProxyType(
+        {
+            CONF_MODBUS_HOST: "192.168.1.100",
+            CONF_MODBUS_PORT: DEFAULT_PORT,
+            CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
+            CONF_PRICE_ENTITY: "sensor.electricity_price",
+            CONF_PRICE_THRESHOLD: 0.05,
+            CONF_CURTAILED_LIMIT: DEFAULT_CURTAILED_LIMIT,
+            CONF_POLL_INTERVAL: DEFAULT_POLL_INTERVAL,
+        }
+    )
 
 
 @pytest.fixture
-def mock_config_entry(config_entry_data: dict[str, Any]) -> MagicMock:
+def mock_config_entry(config_entry_data: Mapping[str, Any]) -> MagicMock:
     """Create a mock config entry."""
     entry = MagicMock()
     entry.entry_id = "test_entry_id"
@@ -105,6 +121,10 @@ def mock_hass() -> MagicMock:
         return task
 
     hass.async_create_task = create_task
+    hass.async_create_background_task = lambda coro, name: create_task(coro)
+
+    # Monotonic event loop clock used for write TTLs
+    hass.loop.time = MagicMock(return_value=1000.0)
 
     return hass
 
@@ -114,43 +134,36 @@ def mock_coordinator(
     mock_hass: MagicMock,
     mock_modbus_client: AsyncMock,
     mock_config_entry: MagicMock,
-) -> MagicMock:
-    """Create a mock coordinator."""
-    from custom_components.bytewatt_export_limiter.coordinator import BytewattCoordinator
-
-    with patch.object(BytewattCoordinator, "__init__", return_value=None):
-        coordinator = BytewattCoordinator.__new__(BytewattCoordinator)
-        coordinator.hass = mock_hass
-        coordinator.modbus_client = mock_modbus_client
-        coordinator.entry = mock_config_entry
-        coordinator.data = {
-            "export_limit": 5000,
-            "grid_max_limit": 10000,
-            "our_limit": None,
-            "their_limit": 10000,
-            "current_price": 0.10,
-            "is_curtailed": False,
-            "automation_enabled": False,
-        }
-        coordinator.last_update_success = True
-        coordinator.their_limit = 10000
-        coordinator.our_limit = None
-        coordinator.current_reading = 5000
-        coordinator.automation_enabled = False
-        coordinator.current_price = 0.10
-        coordinator.price_threshold = 0.05
-        coordinator.curtailed_limit = 0
-
-        # Add device_info property
-        coordinator.device_info = {
+) -> SimpleNamespace:
+    """
+    Create a stand-in coordinator for entity tests.
+
+    Entities only read plain attributes off the coordinator, so a namespace
+    is enough. Methods a test needs to assert on are AsyncMocks.
+    """
+    return SimpleNamespace(
+        hass=mock_hass,
+        modbus_client=mock_modbus_client,
+        entry=mock_config_entry,
+        data=create_coordinator_data(),
+        last_update_success=True,
+        their_limit=10000,
+        our_limit=None,
+        current_reading=5000,
+        automation_enabled=False,
+        current_price=0.10,
+        price_threshold=0.05,
+        curtailed_limit=0,
+        set_export_limit=AsyncMock(return_value=True),
+        set_automation_enabled=AsyncMock(),
+        device_info={
             "identifiers": {(DOMAIN, mock_config_entry.entry_id)},
             "name": "Bytewatt Export Limiter",
             "manufacturer": "Bytewatt",
             "model": "Export Limiter",
             "sw_version": "1.0",
-        }
-
-        return coordinator
+        },
+    )
 
 
 # Helper functions for tests
@@ -165,8 +178,21 @@ def create_modbus_response(registers: list[int] | None = None, is_error: bool =
     return response
 
 
-def create_32bit_registers(value: int) -> list[int]:
-    """Convert a 32-bit value to two 16-bit registers."""
-    high_word = (value >> 16) & 0xFFFF
-    low_word = value & 0xFFFF
-    return [high_word, low_word]
+def create_coordinator_data(**overrides: Any) -> BytewattCoordinatorData:
+    """Create a coordinator data snapshot with sensible defaults."""
+    values: dict[str, Any] = {
+        "export_limit": 5000,
+        "our_limit": None,
+        "their_limit": 10000,
+        "current_price": 0.10,
+        "is_curtailed": False,
+        "automation_enabled": False,
+    }
+    values.update(overrides)
+    return BytewattCoordinatorData(**values)
+
+
+@lru_cache(maxsize=1024)
+def create_32bit_registers(value: int) -> tuple[int, int]:
+    """Convert a 32-bit value to two 16-bit registers (high word first)."""
+    return _U16X2_BE.unpack(_U32_BE.pack(value & 0xFFFFFFFF))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -11,22 +12,22 @@ from custom_components.bytewatt_export_limiter.binary_sensor import (
 )
 from custom_components.bytewatt_export_limiter.const import DOMAIN
 
+from .conftest import create_coordinator_data
+
 
 @pytest.fixture
 def mock_coordinator():
-    """Create a mock coordinator."""
-    coordinator = MagicMock()
-    coordinator.data = {
-        "is_curtailed": False,
-    }
-    coordinator.last_update_success = True
-    coordinator.device_info = {
-        "identifiers": {(DOMAIN, "test_entry")},
-        "name": "Bytewatt Export Limiter",
-        "manufacturer": "Bytewatt",
-        "model": "Export Limiter",
-    }
-    return coordinator
+    """Create a stand-in coordinator (plain attributes - nothing is call-tracked)."""
+    return SimpleNamespace(
+        data=create_coordinator_data(is_curtailed=False),
+        last_update_success=True,
+        device_info={
+            "identifiers": {(DOMAIN, "test_entry")},
+            "name": "Bytewatt Export Limiter",
+            "manufacturer": "Bytewatt",
+            "model": "Export Limiter",
+        },
+    )
 
 
 @pytest.fixture
@@ -42,7 +43,7 @@ class TestExportCurtailedSensor:
 
     def test_is_on_false_when_not_curtailed(self, mock_coordinator, mock_config_entry):
         """Test is_on returns False when not curtailed."""
-        mock_coordinator.data["is_curtailed"] = False
+        mock_coordinator.data = create_coordinator_data(is_curtailed=False)
 
         sensor = BytewattCurtailedBinarySensor(mock_coordinator, mock_config_entry)
 
@@ -50,7 +51,7 @@ class TestExportCurtailedSensor:
 
     def test_is_on_true_when_curtailed(self, mock_coordinator, mock_config_entry):
         """Test is_on returns True when curtailed."""
-        mock_coordinator.data["is_curtailed"] = True
+        mock_coordinator.data = create_coordinator_data(is_curtailed=True)
 
         sensor = BytewattCurtailedBinarySensor(mock_coordinator, mock_config_entry)
 
@@ -74,7 +75,8 @@ class TestExportCurtailedSensor:
         """Test device info is from coordinator."""
         sensor = BytewattCurtailedBinarySensor(mock_coordinator, mock_config_entry)
 
-        assert sensor.device_info == mock_coordinator.device_info
+        # The coordinator's dict is shared, not rebuilt per entity
+        assert sensor.device_info is mock_coordinator.device_info
 
     def test_icon(self, mock_coordinator, mock_config_entry):
         """Test icon is consistent."""
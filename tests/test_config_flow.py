@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -25,10 +26,21 @@ from custom_components.bytewatt_export_limiter.const import (
 )
 
 
+@pytest.fixture
+def mock_validate(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Replace the Modbus connection check with a mock that succeeds by default."""
+    mock = AsyncMock(return_value={"title": "Bytewatt (192.168.1.100)"})
+    monkeypatch.setattr(
+        "custom_components.bytewatt_export_limiter.config_flow.validate_modbus_connection",
+        mock,
+    )
+    return mock
+
+
+@pytest.mark.usefixtures("mock_validate")
 class TestConfigFlowUserStep:
     """Test the user config flow step (Modbus connection)."""
 
-    @pytest.mark.asyncio
     async def test_form_shows_on_init(self):
         """Test that the form is shown when flow is initialized."""
         flow = BytewattConfigFlow()
@@ -39,8 +51,7 @@ class TestConfigFlowUserStep:
         assert result["type"] == "form"
         assert result["step_id"] == "user"
 
-    @pytest.mark.asyncio
-    async def test_connection_success_proceeds_to_automation(self):
+    async def test_connection_success_proceeds_to_automation(self, mock_validate):
         """Test successful connection proceeds to automation step."""
         flow = BytewattConfigFlow()
         flow.hass = MagicMock()
@@ -50,24 +61,18 @@ class TestConfigFlowUserStep:
         flow.async_set_unique_id = AsyncMock()
         flow._abort_if_unique_id_configured = MagicMock()
 
-        with patch(
-            "custom_components.bytewatt_export_limiter.config_flow.validate_modbus_connection"
-        ) as mock_validate:
-            mock_validate.return_value = {"title": "Bytewatt (192.168.1.100)"}
-
-            result = await flow.async_step_user(
-                {
-                    CONF_MODBUS_HOST: "192.168.1.100",
-                    CONF_MODBUS_PORT: DEFAULT_PORT,
-                    CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
-                }
-            )
+        result = await flow.async_step_user(
+            {
+                CONF_MODBUS_HOST: "192.168.1.100",
+                CONF_MODBUS_PORT: DEFAULT_PORT,
+                CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
+            }
+        )
 
         assert result["type"] == "form"
         assert result["step_id"] == "automation"
 
-    @pytest.mark.asyncio
-    async def test_connection_failure_shows_error(self):
+    async def test_connection_failure_shows_error(self, mock_validate):
         """Test connection failure shows error."""
         flow = BytewattConfigFlow()
         flow.hass = MagicMock()
@@ -77,18 +82,15 @@ class TestConfigFlowUserStep:
         flow.async_set_unique_id = AsyncMock()
         flow._abort_if_unique_id_configured = MagicMock()
 
-        with patch(
-            "custom_components.bytewatt_export_limiter.config_flow.validate_modbus_connection"
-        ) as mock_validate:
-            mock_validate.side_effect = CannotConnect("Connection failed")
+        mock_validate.side_effect = CannotConnect("Connection failed")
 
-            result = await flow.async_step_user(
-                {
-                    CONF_MODBUS_HOST: "192.168.1.100",
-                    CONF_MODBUS_PORT: DEFAULT_PORT,
-                    CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
-                }
-            )
+        result = await flow.async_step_user(
+            {
+                CONF_MODBUS_HOST: "192.168.1.100",
+                CONF_MODBUS_PORT: DEFAULT_PORT,
+                CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
+            }
+        )
 
         assert result["type"] == "form"
         assert result["step_id"] == "user"
@@ -96,8 +98,7 @@ class TestConfigFlowUserStep:
         assert "base" in result["errors"]
         assert result["errors"]["base"] == "cannot_connect"
 
-    @pytest.mark.asyncio
-    async def test_connection_invalid_slave_shows_error(self):
+    async def test_connection_invalid_slave_shows_error(self, mock_validate):
         """Test invalid slave address shows error."""
         flow = BytewattConfigFlow()
         flow.hass = MagicMock()
@@ -107,26 +108,22 @@ class TestConfigFlowUserStep:
         flow.async_set_unique_id = AsyncMock()
         flow._abort_if_unique_id_configured = MagicMock()
 
-        with patch(
-            "custom_components.bytewatt_export_limiter.config_flow.validate_modbus_connection"
-        ) as mock_validate:
-            mock_validate.side_effect = InvalidAuth("Invalid slave")
+        mock_validate.side_effect = InvalidAuth("Invalid slave")
 
-            result = await flow.async_step_user(
-                {
-                    CONF_MODBUS_HOST: "192.168.1.100",
-                    CONF_MODBUS_PORT: DEFAULT_PORT,
-                    CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
-                }
-            )
+        result = await flow.async_step_user(
+            {
+                CONF_MODBUS_HOST: "192.168.1.100",
+                CONF_MODBUS_PORT: DEFAULT_PORT,
+                CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
+            }
+        )
 
         assert result["type"] == "form"
         assert result["step_id"] == "user"
         assert "errors" in result
         assert result["errors"]["base"] == "invalid_slave"
 
-    @pytest.mark.asyncio
-    async def test_connection_timeout_shows_error(self):
+    async def test_connection_timeout_shows_error(self, mock_validate):
         """Test connection timeout shows error."""
         flow = BytewattConfigFlow()
         flow.hass = MagicMock()
@@ -136,28 +133,25 @@ class TestConfigFlowUserStep:
         flow.async_set_unique_id = AsyncMock()
         flow._abort_if_unique_id_configured = MagicMock()
 
-        with patch(
-            "custom_components.bytewatt_export_limiter.config_flow.validate_modbus_connection"
-        ) as mock_validate:
-            mock_validate.side_effect = CannotConnect("Connection timed out")
+        mock_validate.side_effect = CannotConnect("Connection timed out")
 
-            result = await flow.async_step_user(
-                {
-                    CONF_MODBUS_HOST: "192.168.1.100",
-                    CONF_MODBUS_PORT: DEFAULT_PORT,
-                    CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
-                }
-            )
+        result = await flow.async_step_user(
+            {
+                CONF_MODBUS_HOST: "192.168.1.100",
+                CONF_MODBUS_PORT: DEFAULT_PORT,
+                CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
+            }
+        )
 
         assert result["type"] == "form"
         assert "errors" in result
         assert result["errors"]["base"] == "cannot_connect"
 
 
+@pytest.mark.usefixtures("mock_validate")
 class TestConfigFlowAutomationStep:
     """Test the automation config flow step."""
 
-    @pytest.mark.asyncio
     async def test_automation_step_creates_entry(self):
         """Test automation step creates config entry."""
         flow = BytewattConfigFlow()
@@ -174,17 +168,13 @@ class TestConfigFlowAutomationStep:
         flow.hass.states.get = MagicMock(return_value=price_state)
 
         # First complete user step with mocked validation
-        with patch(
-            "custom_components.bytewatt_export_limiter.config_flow.validate_modbus_connection"
-        ) as mock_validate:
-            mock_validate.return_value = {"title": "Bytewatt (192.168.1.100)"}
-            await flow.async_step_user(
-                {
-                    CONF_MODBUS_HOST: "192.168.1.100",
-                    CONF_MODBUS_PORT: DEFAULT_PORT,
-                    CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
-                }
-            )
+        await flow.async_step_user(
+            {
+                CONF_MODBUS_HOST: "192.168.1.100",
+                CONF_MODBUS_PORT: DEFAULT_PORT,
+                CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
+            }
+        )
 
         # Then complete automation step
         result = await flow.async_step_automation(
@@ -201,7 +191,6 @@ class TestConfigFlowAutomationStep:
         assert CONF_MODBUS_HOST in result["data"]
         assert CONF_PRICE_ENTITY in result["data"]
 
-    @pytest.mark.asyncio
     async def test_automation_step_invalid_price_entity(self):
         """Test automation step with invalid price entity."""
         flow = BytewattConfigFlow()
@@ -216,17 +205,13 @@ class TestConfigFlowAutomationStep:
         flow.hass.states.get = MagicMock(return_value=None)
 
         # First complete user step with mocked validation
-        with patch(
-            "custom_components.bytewatt_export_limiter.config_flow.validate_modbus_connection"
-        ) as mock_validate:
-            mock_validate.return_value = {"title": "Bytewatt (192.168.1.100)"}
-            await flow.async_step_user(
-                {
-                    CONF_MODBUS_HOST: "192.168.1.100",
-                    CONF_MODBUS_PORT: DEFAULT_PORT,
-                    CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
-                }
-            )
+        await flow.async_step_user(
+            {
+                CONF_MODBUS_HOST: "192.168.1.100",
+                CONF_MODBUS_PORT: DEFAULT_PORT,
+                CONF_MODBUS_SLAVE: DEFAULT_SLAVE,
+            }
+        )
 
         # Then complete automation step with invalid entity
         result = await flow.async_step_automation(
@@ -247,7 +232,6 @@ class TestConfigFlowAutomationStep:
 class TestConfigFlowDuplicateCheck:
     """Test duplicate entry checking."""
 
-    @pytest.mark.asyncio
     async def test_duplicate_entry_aborts(self):
         """Test that duplicate entries are aborted."""
         from homeassistant.data_entry_flow import AbortFlow
@@ -274,10 +258,75 @@ class TestConfigFlowDuplicateCheck:
         assert exc_info.value.reason == "already_configured"
 
 
+class TestConfigFlowSharedGateway:
+    """Test adding a second slave behind a gateway a loaded entry already uses."""
+
+    @staticmethod
+    def _make_flow(existing_client: MagicMock) -> BytewattConfigFlow:
+        """Create a flow whose hass has a loaded entry holding existing_client."""
+        from custom_components.bytewatt_export_limiter.const import DOMAIN
+
+        flow = BytewattConfigFlow()
+        flow.hass = MagicMock()
+        flow.hass.data = {DOMAIN: {"loaded_entry": SimpleNamespace(modbus_client=existing_client)}}
+        flow.context = {}
+        flow.async_set_unique_id = AsyncMock()
+        flow._abort_if_unique_id_configured = MagicMock()
+        return flow
+
+    @staticmethod
+    def _make_client() -> MagicMock:
+        """Create the loaded entry's client, connected to slave 85."""
+        client = MagicMock()
+        client.host = "192.168.1.100"
+        client.port = DEFAULT_PORT
+        client.slave_address = 85
+        client.read_device_registers = AsyncMock(return_value=[0, 5000])
+        return client
+
+    async def test_second_slave_validated_through_existing_client(self):
+        """Test another slave on the same host:port is read over the open connection."""
+        existing_client = self._make_client()
+        flow = self._make_flow(existing_client)
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.config_flow.AsyncModbusTcpClient"
+        ) as mock_class:
+            result = await flow.async_step_user(
+                {
+                    CONF_MODBUS_HOST: "192.168.1.100",
+                    CONF_MODBUS_PORT: DEFAULT_PORT,
+                    CONF_MODBUS_SLAVE: 1,
+                }
+            )
+
+        assert result["type"] == "form"
+        assert result["step_id"] == "automation"
+        flow.async_set_unique_id.assert_called_once_with("192.168.1.100_1")
+        existing_client.read_device_registers.assert_called_once_with(1, 0x08A2, count=2)
+        mock_class.assert_not_called()
+
+    async def test_second_slave_rejected_shows_error(self):
+        """Test a slave the gateway rejects is reported as invalid."""
+        existing_client = self._make_client()
+        existing_client.read_device_registers.return_value = None
+        flow = self._make_flow(existing_client)
+
+        result = await flow.async_step_user(
+            {
+                CONF_MODBUS_HOST: "192.168.1.100",
+                CONF_MODBUS_PORT: DEFAULT_PORT,
+                CONF_MODBUS_SLAVE: 1,
+            }
+        )
+
+        assert result["type"] == "form"
+        assert result["errors"]["base"] == "invalid_slave"
+
+
 class TestValidateModbusConnection:
     """Test the validate_modbus_connection function."""
 
-    @pytest.mark.asyncio
     async def test_validate_success(self):
         """Test successful connection validation."""
         from custom_components.bytewatt_export_limiter.config_flow import (
@@ -286,7 +335,9 @@ class TestValidateModbusConnection:
 
         mock_hass = MagicMock()
 
-        with patch("pymodbus.client.AsyncModbusTcpClient") as mock_class:
+        with patch(
+            "custom_components.bytewatt_export_limiter.config_flow.AsyncModbusTcpClient"
+        ) as mock_class:
             mock_client = AsyncMock()
             mock_client.connect = AsyncMock(return_value=True)
             mock_client.close = MagicMock()
@@ -304,7 +355,6 @@ class TestValidateModbusConnection:
         assert "title" in result
         assert "Bytewatt" in result["title"]
 
-    @pytest.mark.asyncio
     async def test_validate_connection_fails(self):
         """Test connection failure."""
         from custom_components.bytewatt_export_limiter.config_flow import (
@@ -314,7 +364,9 @@ class TestValidateModbusConnection:
 
         mock_hass = MagicMock()
 
-        with patch("pymodbus.client.AsyncModbusTcpClient") as mock_class:
+        with patch(
+            "custom_components.bytewatt_export_limiter.config_flow.AsyncModbusTcpClient"
+        ) as mock_class:
             mock_client = AsyncMock()
             mock_client.connect = AsyncMock(return_value=False)
             mock_client.close = MagicMock()
@@ -324,7 +376,40 @@ class TestValidateModbusConnection:
             with pytest.raises(CannotConnect):
                 await validate_modbus_connection(mock_hass, "192.168.1.100", 502, 85)
 
-    @pytest.mark.asyncio
+    async def test_validate_timeout(self):
+        """Test a slow device fails validation within the shared deadline."""
+        import asyncio
+
+        from custom_components.bytewatt_export_limiter.config_flow import (
+            CannotConnect,
+            validate_modbus_connection,
+        )
+
+        mock_hass = MagicMock()
+
+        with (
+            patch(
+                "custom_components.bytewatt_export_limiter.config_flow.AsyncModbusTcpClient"
+            ) as mock_class,
+            patch(
+                "custom_components.bytewatt_export_limiter.config_flow.asyncio.timeout",
+                return_value=asyncio.timeout(0.01),
+            ),
+        ):
+            mock_client = AsyncMock()
+            mock_client.close = MagicMock()
+
+            async def slow_connect():
+                await asyncio.sleep(1)
+
+            mock_client.connect = slow_connect
+            mock_class.return_value = mock_client
+
+            with pytest.raises(CannotConnect):
+                await validate_modbus_connection(mock_hass, "192.168.1.100", 502, 85)
+
+            mock_client.close.assert_called_once()
+
     async def test_validate_register_read_fails(self):
         """Test register read failure."""
         from custom_components.bytewatt_export_limiter.config_flow import (
@@ -334,7 +419,9 @@ class TestValidateModbusConnection:
 
         mock_hass = MagicMock()
 
-        with patch("pymodbus.client.AsyncModbusTcpClient") as mock_class:
+        with patch(
+            "custom_components.bytewatt_export_limiter.config_flow.AsyncModbusTcpClient"
+        ) as mock_class:
             mock_client = AsyncMock()
             mock_client.connect = AsyncMock(return_value=True)
             mock_client.close = MagicMock()
@@ -353,7 +440,6 @@ class TestValidateModbusConnection:
 class TestOptionsFlow:
     """Test options flow."""
 
-    @pytest.mark.asyncio
     async def test_options_flow_init(self):
         """Test options flow initialization."""
         # Create mock entry
@@ -379,7 +465,26 @@ class TestOptionsFlow:
         assert result["type"] == "form"
         assert result["step_id"] == "init"
 
-    @pytest.mark.asyncio
+    async def test_options_flow_defaults_prefer_options(self):
+        """Test form defaults come from options first, then entry data."""
+        entry = MagicMock()
+        entry.data = {
+            CONF_PRICE_ENTITY: "sensor.electricity_price",
+            CONF_PRICE_THRESHOLD: 0.05,
+            CONF_CURTAILED_LIMIT: 0,
+            CONF_POLL_INTERVAL: 60,
+        }
+        entry.options = {CONF_CURTAILED_LIMIT: 1500}
+
+        flow = BytewattOptionsFlow(entry)
+        flow.hass = MagicMock()
+
+        result = await flow.async_step_init()
+
+        defaults = {str(key): key.default() for key in result["data_schema"].schema}
+        assert defaults[CONF_CURTAILED_LIMIT] == 1500
+        assert defaults[CONF_PRICE_THRESHOLD] == 0.05
+
     async def test_options_flow_update(self):
         """Test options flow update."""
         # Create mock entry
@@ -413,7 +518,6 @@ class TestOptionsFlow:
         assert result["data"][CONF_PRICE_THRESHOLD] == 0.10
         assert result["data"][CONF_CURTAILED_LIMIT] == 1000
 
-    @pytest.mark.asyncio
     async def test_options_flow_invalid_price_entity(self):
         """Test options flow rejects invalid price entity."""
         # Create mock entry
@@ -17,16 +17,23 @@ from custom_components.bytewatt_export_limiter.const import (
     CONF_PRICE_ENTITY,
     CONF_PRICE_THRESHOLD,
     DOMAIN,
+    OVERRIDE_CHECK_INTERVAL,
+    POLL_BLOCK_COUNT,
+    POLL_BLOCK_START,
+    POLL_REGISTERS,
+    POST_WRITE_VERIFY_SECONDS,
+    PRICE_DEBOUNCE_SECONDS,
     REG_EXPORT_LIMIT,
 )
 from custom_components.bytewatt_export_limiter.coordinator import BytewattCoordinator
+from custom_components.bytewatt_export_limiter.modbus_client import WriteSupersededError
 
 
 @pytest.fixture
 def mock_modbus_client():
     """Create a mock Modbus client."""
     client = AsyncMock()
-    client.read_register_single = AsyncMock(return_value=5000)
+    client.read_block = AsyncMock(return_value=[5000])
     client.write_register = AsyncMock(return_value=True)
     client.is_connected = True
     return client
@@ -47,6 +54,10 @@ def mock_hass():
         return asyncio.ensure_future(coro)
 
     hass.async_create_task = create_task
+    hass.async_create_background_task = lambda coro, name: create_task(coro)
+
+    # Monotonic event loop clock used for write TTLs
+    hass.loop.time = MagicMock(return_value=1000.0)
     return hass
 
 
@@ -101,14 +112,26 @@ class TestCoordinatorInit:
             assert coordinator.price_threshold == 0.10
             assert coordinator.curtailed_limit == 1000
 
+    def test_write_ttl_follows_poll_interval(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test the last-write TTL is precomputed as three poll intervals."""
+        mock_config_entry.options = {CONF_POLL_INTERVAL: 30}
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+
+            assert coordinator._ttl_seconds == 90.0
+
 
 class TestCoordinatorDataFetch:
     """Test data fetching."""
 
-    @pytest.mark.asyncio
     async def test_fetch_data_success(self, mock_hass, mock_modbus_client, mock_config_entry):
         """Test successful data fetch."""
-        mock_modbus_client.read_register_single = AsyncMock(return_value=5000)
+        mock_modbus_client.read_block = AsyncMock(return_value=[5000])
 
         with patch(
             "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
@@ -118,14 +141,35 @@ class TestCoordinatorDataFetch:
             data = await coordinator._fetch_data()
 
             assert data["export_limit"] == 5000
+            mock_modbus_client.read_block.assert_called_once_with(
+                POLL_BLOCK_START, POLL_BLOCK_COUNT
+            )
+
+    async def test_fetch_data_decodes_block_by_name(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test every polled register is decoded by its offset into the block."""
+        block = list(range(100, 100 + POLL_BLOCK_COUNT))
+        mock_modbus_client.read_block = AsyncMock(return_value=block)
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+
+            data = await coordinator._fetch_data()
+
+            assert data == {
+                name: block[address - POLL_BLOCK_START] for name, address in POLL_REGISTERS.items()
+            }
+            assert data["export_limit"] == block[REG_EXPORT_LIMIT - POLL_BLOCK_START]
 
-    @pytest.mark.asyncio
     async def test_fetch_data_retry_on_failure(
         self, mock_hass, mock_modbus_client, mock_config_entry
     ):
         """Test data fetch retry logic."""
         # First call fails, second succeeds
-        mock_modbus_client.read_register_single = AsyncMock(side_effect=[None, 5000])
+        mock_modbus_client.read_block = AsyncMock(side_effect=[None, [5000]])
 
         with patch(
             "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
@@ -135,16 +179,41 @@ class TestCoordinatorDataFetch:
             data = await coordinator._fetch_data()
 
             assert data["export_limit"] == 5000
-            assert mock_modbus_client.read_register_single.call_count == 2
+            assert mock_modbus_client.read_block.call_count == 2
+
+    async def test_fetch_data_retry_backoff(self, mock_hass, mock_modbus_client, mock_config_entry):
+        """Test retries back off exponentially, skipping the delay after a dropped connection."""
+        mock_modbus_client.read_block = AsyncMock(side_effect=[None, None, [5000]])
+        mock_modbus_client.is_connected = False
+
+        with (
+            patch(
+                "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+            ),
+            patch(
+                "custom_components.bytewatt_export_limiter.coordinator.asyncio.sleep",
+                new=AsyncMock(),
+            ) as mock_sleep,
+            patch(
+                "custom_components.bytewatt_export_limiter.coordinator.random.random",
+                return_value=0.0,
+            ),
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+
+            data = await coordinator._fetch_data()
+
+            assert data["export_limit"] == 5000
+            # First retry is immediate, second waits 2 * base delay
+            mock_sleep.assert_awaited_once_with(0.1)
 
-    @pytest.mark.asyncio
     async def test_fetch_data_failure_after_retries(
         self, mock_hass, mock_modbus_client, mock_config_entry
     ):
         """Test data fetch fails after all retries."""
         from homeassistant.helpers.update_coordinator import UpdateFailed
 
-        mock_modbus_client.read_register_single = AsyncMock(return_value=None)
+        mock_modbus_client.read_block = AsyncMock(return_value=None)
 
         with patch(
             "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
@@ -158,12 +227,11 @@ class TestCoordinatorDataFetch:
 class TestCoordinatorStateTracking:
     """Test state tracking logic."""
 
-    @pytest.mark.asyncio
     async def test_their_limit_initialized_on_first_read(
         self, mock_hass, mock_modbus_client, mock_config_entry
     ):
         """Test their_limit is set on first successful read."""
-        mock_modbus_client.read_register_single = AsyncMock(return_value=8000)
+        mock_modbus_client.read_block = AsyncMock(return_value=[8000])
 
         with patch(
             "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
@@ -178,7 +246,6 @@ class TestCoordinatorStateTracking:
             assert coordinator.their_limit == 8000
             assert coordinator.current_reading == 8000
 
-    @pytest.mark.asyncio
     async def test_grid_override_detection(self, mock_hass, mock_modbus_client, mock_config_entry):
         """Test detection of grid override."""
         with patch(
@@ -191,22 +258,98 @@ class TestCoordinatorStateTracking:
             coordinator.their_limit = 10000
             coordinator.our_limit = 5000
             coordinator.current_reading = 5000
-            coordinator._last_write = None
+            coordinator._last_write_value = None
+            coordinator._last_write_expiry = 0.0
             coordinator._write_in_progress = False
 
             # Simulate grid override - current reading changed to something else
-            mock_modbus_client.read_register_single = AsyncMock(return_value=8000)
+            mock_modbus_client.read_block = AsyncMock(return_value=[8000])
 
             await coordinator._async_update_data()
 
             # their_limit should be updated to the new grid-imposed value
             assert coordinator.their_limit == 8000
 
+    async def test_steady_override_rechecked_every_n_polls(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test a steady overridden reading is re-applied only on periodic checks."""
+        mock_modbus_client.read_block = AsyncMock(return_value=[8000])
+        mock_modbus_client.write_register = AsyncMock(return_value=False)
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+            coordinator.their_limit = 10000
+            coordinator.our_limit = 5000
+            coordinator.current_reading = 5000
+
+            # Reading changed - override detected and re-apply attempted at once
+            await coordinator._async_update_data()
+            assert mock_modbus_client.write_register.call_count == 1
+
+            # Steady reading - the failed re-apply is retried on the periodic check only
+            # (once the write backoff has elapsed)
+            mock_hass.loop.time.return_value = 1000.0 + 10
+            for _ in range(OVERRIDE_CHECK_INTERVAL):
+                await coordinator._async_update_data()
+            assert mock_modbus_client.write_register.call_count == 2
+
+    async def test_unchanged_poll_reuses_snapshot(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test a poll that changes nothing returns the previous snapshot object."""
+        mock_modbus_client.read_block = AsyncMock(return_value=[8000])
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+
+            first = await coordinator._async_update_data()
+            coordinator.data = first
+            second = await coordinator._async_update_data()
+            assert second is first
+
+            # Any change produces a fresh snapshot
+            coordinator.current_price = 0.42
+            third = await coordinator._async_update_data()
+            assert third is not first
+            assert third.current_price == 0.42
+
+    async def test_last_write_expires_on_loop_clock(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test the last-write TTL is measured on the event loop's monotonic clock."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+            coordinator.update_interval = timedelta(seconds=60)
+            coordinator.their_limit = 10000
+            mock_modbus_client.write_register = AsyncMock(return_value=True)
+            mock_hass.loop.time.return_value = 1000.0
+            await coordinator._write_limit(5000)
+            assert coordinator._last_write_expiry == 1000.0 + 180
+
+            # Within 3 poll cycles our own write is not mistaken for an override
+            mock_hass.loop.time.return_value = 1000.0 + 179
+            mock_modbus_client.read_block = AsyncMock(return_value=[5000])
+            await coordinator._async_update_data()
+            assert coordinator.their_limit == 10000
+
+            # After 3 poll cycles the write no longer masks a change; the reading
+            # is steady, so it is picked up on the next periodic override check
+            mock_hass.loop.time.return_value = 1000.0 + 181
+            for _ in range(OVERRIDE_CHECK_INTERVAL):
+                await coordinator._async_update_data()
+            assert coordinator.their_limit == 5000
+
 
 class TestCoordinatorPriceAutomation:
     """Test price-based automation."""
 
-    @pytest.mark.asyncio
     async def test_automation_disabled_no_action(
         self, mock_hass, mock_modbus_client, mock_config_entry
     ):
@@ -224,7 +367,6 @@ class TestCoordinatorPriceAutomation:
             # No write should occur
             mock_modbus_client.write_register.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_automation_curtails_on_low_price(
         self, mock_hass, mock_modbus_client, mock_config_entry
     ):
@@ -246,7 +388,6 @@ class TestCoordinatorPriceAutomation:
             call_args = mock_modbus_client.write_register.call_args
             assert call_args[0][1] == 0  # curtailed_limit
 
-    @pytest.mark.asyncio
     async def test_automation_restores_on_high_price(
         self, mock_hass, mock_modbus_client, mock_config_entry
     ):
@@ -268,7 +409,6 @@ class TestCoordinatorPriceAutomation:
             call_args = mock_modbus_client.write_register.call_args
             assert call_args[0][1] == 10000  # their_limit
 
-    @pytest.mark.asyncio
     async def test_no_write_when_target_matches_current(
         self, mock_hass, mock_modbus_client, mock_config_entry
     ):
@@ -288,11 +428,359 @@ class TestCoordinatorPriceAutomation:
             # No write needed - already at target
             mock_modbus_client.write_register.assert_not_called()
 
+    async def test_identical_write_skipped(self, mock_hass, mock_modbus_client, mock_config_entry):
+        """Test writing the value already on the device is skipped."""
+        mock_modbus_client.write_register = AsyncMock(return_value=True)
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+
+            assert await coordinator._write_limit(0) is True
+            assert await coordinator._write_limit(0) is True
+
+            mock_modbus_client.write_register.assert_called_once_with(REG_EXPORT_LIMIT, 0)
+
+    async def test_superseded_write_not_treated_as_failure(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test a write replaced by a newer one neither backs off nor records a value."""
+        mock_modbus_client.write_register = AsyncMock(
+            side_effect=[WriteSupersededError("superseded"), True]
+        )
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+
+            assert await coordinator._write_limit(1000) is True
+            assert coordinator._write_fail_count == 0
+            assert coordinator._last_written_limit is None
+
+            # The next write goes straight out - no backoff window was opened
+            assert await coordinator._write_limit(2000) is True
+            assert coordinator._last_written_limit == 2000
+            assert mock_modbus_client.write_register.call_count == 2
+
+    async def test_write_cache_invalidated_on_drift(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test a poll reading a different value forces the next write out."""
+        mock_modbus_client.write_register = AsyncMock(return_value=True)
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+            coordinator.update_interval = timedelta(seconds=60)
+            coordinator.their_limit = 10000
+
+            await coordinator._write_limit(0)
+
+            # Something else changed the register
+            mock_modbus_client.read_block = AsyncMock(return_value=[8000])
+            await coordinator._async_update_data()
+
+            await coordinator._write_limit(0)
+
+            assert mock_modbus_client.write_register.call_count == 2
+
+    async def test_concurrent_price_logic_serialized(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test concurrent price logic runs never overlap their Modbus writes."""
+        active = 0
+        max_active = 0
+
+        async def slow_write(address, value):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return True
+
+        mock_modbus_client.write_register = AsyncMock(side_effect=slow_write)
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+            coordinator.automation_enabled = True
+            coordinator.their_limit = 10000
+            # Neither target matches the reading, so both runs must write
+            coordinator.current_reading = 5000
+            coordinator.curtailed_limit = 0
+
+            async def flip_and_apply(price):
+                coordinator.current_price = price
+                await coordinator._apply_price_logic()
+
+            await asyncio.gather(flip_and_apply(0.01), flip_and_apply(0.50))
+
+            assert mock_modbus_client.write_register.call_count == 2
+            assert max_active == 1
+
+    async def test_price_logic_skipped_for_unchanged_inputs(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test price logic only re-runs when its inputs change or it is forced."""
+        mock_modbus_client.write_register = AsyncMock(return_value=False)
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+            coordinator.automation_enabled = True
+            coordinator.their_limit = 10000
+            coordinator.current_reading = 10000
+            coordinator.current_price = 0.50
+
+            # No write needed - the decision is remembered
+            await coordinator._apply_price_logic()
+            assert coordinator._price_logic_inputs is not None
+            await coordinator._apply_price_logic()
+
+            with patch.object(coordinator, "_write_limit", new=AsyncMock()) as mock_write:
+                await coordinator._apply_price_logic()
+                mock_write.assert_not_awaited()
+
+            # A failed write is retried on the next call with the same inputs
+            coordinator.current_price = 0.01
+            await coordinator._apply_price_logic()
+            assert coordinator._price_logic_inputs is None
+            mock_hass.loop.time.return_value = 1000.0 + 10
+            await coordinator._apply_price_logic()
+            assert mock_modbus_client.write_register.call_count == 2
+
+            # A successful write is remembered against the reading it produced
+            mock_modbus_client.write_register = AsyncMock(return_value=True)
+            mock_hass.loop.time.return_value = 1000.0 + 100
+            await coordinator._apply_price_logic()
+            await coordinator._apply_price_logic()
+            assert mock_modbus_client.write_register.call_count == 1
+
+            # force re-evaluates regardless
+            coordinator.our_limit = None
+            await coordinator._apply_price_logic()
+            assert coordinator.our_limit is None
+            await coordinator._apply_price_logic(force=True)
+            assert coordinator.our_limit == 0
+
+    async def test_poll_skips_price_logic_when_disabled(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test polls don't enter the price logic while automation is off."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+            coordinator.automation_enabled = False
+
+            with patch.object(coordinator, "_apply_price_logic", new=AsyncMock()) as mock_logic:
+                await coordinator._async_update_data()
+                mock_logic.assert_not_awaited()
+
+                coordinator.automation_enabled = True
+                await coordinator._async_update_data()
+                mock_logic.assert_awaited_once()
+
+    async def test_successful_write_updates_reading_optimistically(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test a successful write is reflected in current_reading before the next poll."""
+        mock_modbus_client.write_register = AsyncMock(return_value=True)
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+            coordinator.current_reading = 10000
+
+            assert await coordinator._write_limit(2000) is True
+            assert coordinator.current_reading == 2000
+
+            # Repeating the value is skipped and counted
+            assert await coordinator._write_limit(2000) is True
+            assert mock_modbus_client.write_register.call_count == 1
+            assert coordinator._writes_saved == 1
+
+            # A failed write leaves the last known reading alone
+            mock_modbus_client.write_register = AsyncMock(return_value=False)
+            assert await coordinator._write_limit(3000) is False
+            assert coordinator.current_reading == 2000
+
+    async def test_successful_write_schedules_single_verify(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test a successful write arms one read-back refresh shortly after."""
+        mock_modbus_client.write_register = AsyncMock(return_value=True)
+        mock_hass.loop.call_later = MagicMock()
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+            coordinator.async_refresh = AsyncMock()
+
+            await coordinator._write_limit(2000)
+            await coordinator._write_limit(3000)
+
+            # Both writes share the one pending verification
+            mock_hass.loop.call_later.assert_called_once()
+            delay, callback_fn, ref = mock_hass.loop.call_later.call_args.args
+            assert delay == POST_WRITE_VERIFY_SECONDS
+
+            callback_fn(ref)
+            await coordinator._verify_write_task
+            coordinator.async_refresh.assert_awaited_once()
+
+            # Failed writes have nothing to verify
+            mock_modbus_client.write_register = AsyncMock(return_value=False)
+            await coordinator._write_limit(4000)
+            mock_hass.loop.call_later.assert_called_once()
+
+    async def test_write_failures_back_off(self, mock_hass, mock_modbus_client, mock_config_entry):
+        """Test consecutive write failures refuse writes for a growing window."""
+        mock_modbus_client.write_register = AsyncMock(return_value=False)
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+
+            assert await coordinator._write_limit(2000) is False
+            assert coordinator._write_skip_until == 1000.0 + 2
+
+            # Inside the window nothing reaches the device
+            mock_hass.loop.time.return_value = 1001.0
+            assert await coordinator._write_limit(2000) is False
+            assert mock_modbus_client.write_register.call_count == 1
+
+            # The next failure doubles the window
+            mock_hass.loop.time.return_value = 1002.0
+            assert await coordinator._write_limit(2000) is False
+            assert coordinator._write_skip_until == 1002.0 + 4
+
+            # A success clears the backoff
+            mock_modbus_client.write_register = AsyncMock(return_value=True)
+            mock_hass.loop.time.return_value = 1010.0
+            assert await coordinator._write_limit(2000) is True
+            assert coordinator._write_fail_count == 0
+            assert coordinator._write_skip_until == 0.0
+
+    def test_price_burst_arms_single_timer(self, mock_hass, mock_modbus_client, mock_config_entry):
+        """Test a burst of price changes arms one timer and only pushes its deadline."""
+        handle = MagicMock()
+        mock_hass.loop.call_at = MagicMock(return_value=handle)
+        mock_hass.async_create_background_task = MagicMock()
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+
+            for now, price in ((1000.0, "0.10"), (1002.0, "0.02")):
+                mock_hass.loop.time.return_value = now
+                new_state = MagicMock()
+                new_state.state = price
+                coordinator._handle_price_change(MagicMock(data={"new_state": new_state}))
+
+            assert coordinator.current_price == 0.02
+            mock_hass.loop.call_at.assert_called_once()
+            handle.cancel.assert_not_called()
+            assert coordinator._price_debounce_deadline == 1002.0 + PRICE_DEBOUNCE_SECONDS
+
+            # Timer fires at the first deadline - the price moved since, so it
+            # re-arms for the remainder instead of running the logic
+            mock_hass.loop.time.return_value = 1000.0 + PRICE_DEBOUNCE_SECONDS
+            coordinator._on_price_debounce_expired()
+            assert mock_hass.loop.call_at.call_count == 2
+            assert mock_hass.loop.call_at.call_args.args[0] == 1002.0 + PRICE_DEBOUNCE_SECONDS
+            mock_hass.async_create_background_task.assert_not_called()
+
+            # Quiet until the pushed-out deadline - now the logic runs
+            mock_hass.loop.time.return_value = 1002.0 + PRICE_DEBOUNCE_SECONDS
+            coordinator._on_price_debounce_expired()
+            mock_hass.async_create_background_task.assert_called_once()
+            assert coordinator._price_debounce_handle is None
+
+    def test_repeated_price_string_not_reparsed(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test a price string seen before reuses its parsed value."""
+        mock_hass.loop.call_at = MagicMock()
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+
+            for price in ("0.15", "unavailable", "0.15"):
+                new_state = MagicMock()
+                new_state.state = price
+                coordinator._handle_price_change(MagicMock(data={"new_state": new_state}))
+
+            assert coordinator._price_raw_cache == ("0.15", 0.15)
+            assert coordinator.current_price == 0.15
+            # Both real changes (None -> 0.15 twice) fall in one debounce window
+            mock_hass.loop.call_at.assert_called_once()
+
+    def test_price_move_within_threshold_side_not_debounced(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test a price change that doesn't cross the threshold schedules nothing."""
+        mock_hass.loop.call_at = MagicMock()
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+            coordinator.automation_enabled = True
+            coordinator.price_threshold = 0.05
+            coordinator.current_price = 0.10
+
+            for price in ("0.12", "0.30"):
+                new_state = MagicMock()
+                new_state.state = price
+                coordinator._handle_price_change(MagicMock(data={"new_state": new_state}))
+
+            assert coordinator.current_price == 0.30
+            mock_hass.loop.call_at.assert_not_called()
+
+            # Crossing the threshold is debounced as usual
+            new_state = MagicMock()
+            new_state.state = "0.01"
+            coordinator._handle_price_change(MagicMock(data={"new_state": new_state}))
+            mock_hass.loop.call_at.assert_called_once()
+
+    def test_unchanged_price_value_ignored(self, mock_hass, mock_modbus_client, mock_config_entry):
+        """Test a re-posted price that parses to the same value does not re-arm the debounce."""
+        mock_hass.loop.call_at = MagicMock()
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+            coordinator.current_price = 0.1
+
+            old_state = MagicMock()
+            old_state.state = "0.10"
+            new_state = MagicMock()
+            new_state.state = "0.1"
+            coordinator._handle_price_change(
+                MagicMock(data={"old_state": old_state, "new_state": new_state})
+            )
+
+            assert coordinator.current_price == 0.1
+            mock_hass.loop.call_at.assert_not_called()
+
 
 class TestCoordinatorManualControl:
     """Test manual control methods."""
 
-    @pytest.mark.asyncio
     async def test_set_export_limit_success(self, mock_hass, mock_modbus_client, mock_config_entry):
         """Test manual export limit setting."""
         mock_modbus_client.write_register = AsyncMock(return_value=True)
@@ -309,7 +797,61 @@ class TestCoordinatorManualControl:
             assert coordinator.our_limit == 5000
             mock_modbus_client.write_register.assert_called_once_with(REG_EXPORT_LIMIT, 5000)
 
-    @pytest.mark.asyncio
+    async def test_refresh_timeout_does_not_cancel_refresh(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test a bounded refresh gives up waiting without cancelling the refresh."""
+        release = asyncio.Event()
+        finished = asyncio.Event()
+
+        async def slow_refresh():
+            await release.wait()
+            finished.set()
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+            coordinator.async_request_refresh = slow_refresh
+
+            # Returns after the timeout rather than raising
+            await coordinator._safe_request_refresh(timeout=0.01)
+
+            release.set()
+            await asyncio.wait_for(finished.wait(), timeout=1)
+
+    async def test_write_survives_caller_cancellation(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test cancelling a caller mid-write lets the Modbus write finish."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+        completed = asyncio.Event()
+
+        async def slow_write(address, value):
+            started.set()
+            await release.wait()
+            completed.set()
+            return True
+
+        mock_modbus_client.write_register = AsyncMock(side_effect=slow_write)
+
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+
+            task = asyncio.ensure_future(coordinator._write_limit(5000))
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            assert coordinator._write_in_progress is False
+
+            release.set()
+            await asyncio.wait_for(completed.wait(), timeout=1)
+
     async def test_set_export_limit_failure(self, mock_hass, mock_modbus_client, mock_config_entry):
         """Test manual export limit setting failure."""
         mock_modbus_client.write_register = AsyncMock(return_value=False)
@@ -325,7 +867,6 @@ class TestCoordinatorManualControl:
             assert result is False
             assert coordinator.our_limit is None  # Not updated on failure
 
-    @pytest.mark.asyncio
     async def test_set_export_limit_invalid_value(
         self, mock_hass, mock_modbus_client, mock_config_entry
     ):
@@ -340,7 +881,12 @@ class TestCoordinatorManualControl:
             assert result is False
             mock_modbus_client.write_register.assert_not_called()
 
-    @pytest.mark.asyncio
+            # Wider than the 16-bit register
+            result = await coordinator.set_export_limit(0x10000)
+
+            assert result is False
+            mock_modbus_client.write_register.assert_not_called()
+
     async def test_set_automation_enabled(self, mock_hass, mock_modbus_client, mock_config_entry):
         """Test enabling automation."""
         mock_modbus_client.write_register = AsyncMock(return_value=True)
@@ -361,7 +907,6 @@ class TestCoordinatorManualControl:
             # Should apply price logic immediately
             mock_modbus_client.write_register.assert_called()
 
-    @pytest.mark.asyncio
     async def test_set_automation_disabled_reverts(
         self, mock_hass, mock_modbus_client, mock_config_entry
     ):
@@ -383,6 +928,24 @@ class TestCoordinatorManualControl:
             # Should revert to their_limit
             mock_modbus_client.write_register.assert_called()
 
+    async def test_set_automation_unchanged_is_noop(
+        self, mock_hass, mock_modbus_client, mock_config_entry
+    ):
+        """Test re-sending the current automation state does nothing."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.coordinator.async_track_state_change_event"
+        ):
+            coordinator = BytewattCoordinator(mock_hass, mock_modbus_client, mock_config_entry)
+            coordinator.async_request_refresh = AsyncMock()
+            coordinator.automation_enabled = True
+
+            with patch.object(coordinator, "_apply_price_logic", new=AsyncMock()) as mock_logic:
+                await coordinator.set_automation_enabled(True)
+                mock_logic.assert_not_awaited()
+
+            coordinator.async_request_refresh.assert_not_awaited()
+            assert coordinator.automation_enabled is True
+
 
 class TestCoordinatorDeviceInfo:
     """Test device info property."""
@@ -400,12 +963,13 @@ class TestCoordinatorDeviceInfo:
             assert (DOMAIN, mock_config_entry.entry_id) in device_info["identifiers"]
             assert device_info["manufacturer"] == "Bytewatt"
             assert device_info["model"] == "Export Limiter"
+            # Built once, shared by every entity
+            assert coordinator.device_info is device_info
 
 
 class TestCoordinatorCleanup:
     """Test cleanup and shutdown."""
 
-    @pytest.mark.asyncio
     async def test_async_shutdown(self, mock_hass, mock_modbus_client, mock_config_entry):
         """Test shutdown cleans up resources."""
         cancel_mock = MagicMock()
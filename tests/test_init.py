@@ -0,0 +1,69 @@
+"""Tests for integration setup."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
+
+from custom_components.bytewatt_export_limiter import async_setup_entry, async_unload_entry
+from custom_components.bytewatt_export_limiter.const import DOMAIN
+
+
+class TestSetupEntry:
+    """Test how async_setup_entry reports connection failures."""
+
+    async def test_socket_error_is_retried(self, mock_hass, mock_config_entry, mock_modbus_client):
+        """Test a network failure leaves the entry to be retried."""
+        mock_modbus_client.connect.side_effect = OSError("Connection refused")
+
+        with pytest.raises(ConfigEntryNotReady):
+            await async_setup_entry(mock_hass, mock_config_entry)
+
+    async def test_invalid_config_is_not_retried(
+        self, mock_hass, mock_config_entry, mock_modbus_client
+    ):
+        """Test a configuration error fails setup without a retry."""
+        mock_modbus_client.connect.side_effect = ValueError("Invalid port")
+
+        with pytest.raises(ConfigEntryError):
+            await async_setup_entry(mock_hass, mock_config_entry)
+
+
+class TestUnloadEntry:
+    """Test coordinator shutdown and Modbus disconnect on unload."""
+
+    @staticmethod
+    def _add_coordinator(mock_hass, mock_config_entry, calls: list[str]) -> SimpleNamespace:
+        """Register a stand-in coordinator that records shutdown/disconnect order."""
+        coordinator = SimpleNamespace(
+            async_shutdown=AsyncMock(side_effect=lambda: calls.append("shutdown")),
+            modbus_client=SimpleNamespace(
+                disconnect=AsyncMock(side_effect=lambda: calls.append("disconnect"))
+            ),
+        )
+        mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: coordinator}}
+        return coordinator
+
+    async def test_disconnect_after_shutdown(self, mock_hass, mock_config_entry):
+        """Test the connection is only closed once the coordinator has stopped."""
+        calls: list[str] = []
+        self._add_coordinator(mock_hass, mock_config_entry, calls)
+
+        assert await async_unload_entry(mock_hass, mock_config_entry) is True
+
+        assert calls == ["shutdown", "disconnect"]
+        assert DOMAIN not in mock_hass.data
+
+    async def test_disconnect_when_shutdown_times_out(self, mock_hass, mock_config_entry):
+        """Test the connection is still closed if shutdown doesn't finish."""
+        calls: list[str] = []
+        coordinator = self._add_coordinator(mock_hass, mock_config_entry, calls)
+        coordinator.async_shutdown.side_effect = TimeoutError
+
+        assert await async_unload_entry(mock_hass, mock_config_entry) is True
+
+        assert calls == ["disconnect"]
@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import socket
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from custom_components.bytewatt_export_limiter.modbus_client import AsyncModbusClient
+from custom_components.bytewatt_export_limiter.modbus_client import (
+    ERROR_RESET_THRESHOLD,
+    WRITE_RETRY_BASE_DELAY,
+    AsyncModbusClient,
+    BatteryReadings,
+    ConfigReadings,
+    WriteSupersededError,
+)
 
 from .conftest import create_32bit_registers, create_modbus_response
 
@@ -15,7 +24,6 @@ from .conftest import create_32bit_registers, create_modbus_response
 class TestAsyncModbusClientConnection:
     """Test connection handling."""
 
-    @pytest.mark.asyncio
     async def test_connect_success(self):
         """Test successful connection."""
         with patch(
@@ -33,7 +41,6 @@ class TestAsyncModbusClientConnection:
             assert client.is_connected is True
             mock_client.connect.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_connect_failure(self):
         """Test connection failure."""
         with patch(
@@ -50,7 +57,6 @@ class TestAsyncModbusClientConnection:
             assert result is False
             assert client.is_connected is False
 
-    @pytest.mark.asyncio
     async def test_connect_timeout(self):
         """Test connection timeout."""
         with patch(
@@ -70,7 +76,6 @@ class TestAsyncModbusClientConnection:
             assert result is False
             assert client.is_connected is False
 
-    @pytest.mark.asyncio
     async def test_connect_exception(self):
         """Test connection exception handling."""
         with patch(
@@ -86,7 +91,21 @@ class TestAsyncModbusClientConnection:
             assert result is False
             assert client.is_connected is False
 
-    @pytest.mark.asyncio
+    async def test_connect_invalid_config_raises(self):
+        """Test a configuration error is raised rather than reported as offline."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(side_effect=ValueError("Invalid port"))
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            with pytest.raises(ValueError):
+                await client.connect()
+
+            assert client.is_connected is False
+
     async def test_disconnect(self):
         """Test disconnection."""
         with patch(
@@ -105,7 +124,6 @@ class TestAsyncModbusClientConnection:
             assert client.is_connected is False
             mock_client.close.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_is_connected_property(self):
         """Test is_connected property."""
         with patch(
@@ -125,11 +143,141 @@ class TestAsyncModbusClientConnection:
             await client.connect()
             assert client.is_connected is True
 
+    async def test_connect_sets_socket_options(self):
+        """Test TCP_NODELAY and SO_KEEPALIVE are applied after connecting."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_socket = MagicMock()
+            mock_transport = MagicMock(spec=asyncio.Transport)
+            mock_transport.get_extra_info.return_value = mock_socket
+
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+            mock_client.ctx = MagicMock(transport=mock_transport)
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            result = await client.connect()
+
+            assert result is True
+            mock_transport.get_extra_info.assert_called_once_with("socket")
+            mock_socket.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            mock_socket.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    async def test_reconnects_when_socket_dropped(self):
+        """Test a socket closed by the device is reconnected before the next request."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+            mock_client.read_holding_registers = AsyncMock(
+                return_value=create_modbus_response([1234])
+            )
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            await client.connect()
+
+            # Device drops the connection between polls
+            mock_client.connected = False
+
+            async def reconnect():
+                mock_client.connected = True
+                return True
+
+            mock_client.connect = AsyncMock(side_effect=reconnect)
+            result = await client.read_register(0x0102)
+
+            assert result == [1234]
+            mock_client.connect.assert_called_once()
+
+    async def test_client_reused_after_error(self):
+        """Test a read error keeps both the client object and its connection."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+            mock_client.close = MagicMock()
+            mock_client.read_holding_registers = AsyncMock(
+                side_effect=[
+                    create_modbus_response(is_error=True),
+                    create_modbus_response([1234]),
+                ]
+            )
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            await client.connect()
+
+            assert await client.read_register(0x0102) is None
+            assert await client.read_register(0x0102) == [1234]
+            mock_pymodbus.assert_called_once()
+            mock_client.connect.assert_called_once()
+            mock_client.close.assert_not_called()
+
+    async def test_read_device_registers_uses_other_slave(self):
+        """Test a read for another slave shares the connection but not the cache."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+            mock_client.read_holding_registers = AsyncMock(
+                side_effect=[
+                    create_modbus_response([0, 5000]),
+                    create_modbus_response(is_error=True),
+                    create_modbus_response([0, 7000]),
+                ]
+            )
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100", slave_address=85)
+            await client.connect()
+
+            assert await client.read_device_registers(1, 0x08A2, count=2) == [0, 5000]
+            assert await client.read_device_registers(2, 0x08A2, count=2) is None
+            assert mock_client.read_holding_registers.call_args.kwargs["device_id"] == 2
+            # The other slave's values never stand in for this client's own
+            assert await client.read_register(0x08A2, count=2, max_age=60) == [0, 7000]
+            assert mock_client.read_holding_registers.call_args.kwargs["device_id"] == 85
+            mock_pymodbus.assert_called_once()
+
+    async def test_connection_reset_after_repeated_errors(self):
+        """Test the socket is only torn down once errors keep coming."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+            mock_client.close = MagicMock()
+            mock_client.read_holding_registers = AsyncMock(
+                return_value=create_modbus_response(is_error=True)
+            )
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            await client.connect()
+
+            for _ in range(ERROR_RESET_THRESHOLD - 1):
+                assert await client.read_register(0x0102) is None
+            mock_client.close.assert_not_called()
+
+            assert await client.read_register(0x0102) is None
+            mock_client.close.assert_called_once()
+            assert client.is_connected is False
+
 
 class TestAsyncModbusClientRead:
     """Test read operations."""
 
-    @pytest.mark.asyncio
     async def test_read_register_success(self):
         """Test successful register read."""
         with patch(
@@ -149,7 +297,6 @@ class TestAsyncModbusClientRead:
 
             assert result == [1234]
 
-    @pytest.mark.asyncio
     async def test_read_register_error_response(self):
         """Test register read with error response."""
         with patch(
@@ -170,7 +317,37 @@ class TestAsyncModbusClientRead:
 
             assert result is None
 
-    @pytest.mark.asyncio
+    async def test_repeated_errors_logged_once(self, caplog):
+        """Test only the first failure in a run is logged at ERROR."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+            mock_client.close = MagicMock()
+            mock_client.read_holding_registers = AsyncMock(
+                side_effect=[
+                    create_modbus_response(is_error=True),
+                    create_modbus_response(is_error=True),
+                    create_modbus_response([1234]),
+                    create_modbus_response(is_error=True),
+                ]
+            )
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            await client.connect()
+
+            caplog.set_level(logging.DEBUG)
+            for _ in range(4):
+                await client.read_register(0x0102)
+
+            errors = [r for r in caplog.records if r.levelno == logging.ERROR]
+            # First failure, then the first failure after recovery
+            assert len(errors) == 2
+            assert "restored" in caplog.text
+
     async def test_read_register_timeout(self):
         """Test register read timeout."""
         with patch(
@@ -193,7 +370,6 @@ class TestAsyncModbusClientRead:
 
             assert result is None
 
-    @pytest.mark.asyncio
     async def test_read_register_32bit_success(self):
         """Test successful 32-bit register read."""
         with patch(
@@ -214,7 +390,6 @@ class TestAsyncModbusClientRead:
 
             assert result == 65536
 
-    @pytest.mark.asyncio
     async def test_read_register_32bit_large_value(self):
         """Test 32-bit register read with large value."""
         with patch(
@@ -235,7 +410,103 @@ class TestAsyncModbusClientRead:
 
             assert result == 10000
 
-    @pytest.mark.asyncio
+    async def test_read_block_success(self):
+        """Test block read returns the whole window from one request."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+            mock_client.read_holding_registers = AsyncMock(
+                return_value=create_modbus_response([1, 0, 5000])
+            )
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            await client.connect()
+            result = await client.read_block(0x08A0, 3)
+
+            assert result == [1, 0, 5000]
+            mock_client.read_holding_registers.assert_called_once()
+
+    async def test_read_cached(self):
+        """Test cached reads are served locally until they age out."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+            mock_client.read_holding_registers = AsyncMock(
+                return_value=create_modbus_response([50, 0, 7])
+            )
+            mock_client.write_register = AsyncMock(return_value=create_modbus_response())
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            await client.connect()
+
+            # A block read fills the cache for every register in it
+            await client.read_block(0x0800, 3)
+            assert await client.read_cached(0x0802, max_age=60) == 7
+            mock_client.read_holding_registers.assert_called_once()
+
+            # Writes update it too
+            await client.write_register(0x0800, 80)
+            assert await client.read_cached(0x0800, max_age=60) == 80
+            mock_client.read_holding_registers.assert_called_once()
+
+            # Too old - goes back to the device
+            mock_client.read_holding_registers.return_value = create_modbus_response([9])
+            assert await client.read_cached(0x0802, max_age=-1) == 9
+            assert mock_client.read_holding_registers.call_count == 2
+
+    async def test_read_register_max_age_needs_whole_range(self):
+        """Test a cached range is only served when every register in it is fresh."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+            mock_client.read_holding_registers = AsyncMock(
+                return_value=create_modbus_response([1, 2])
+            )
+            mock_client.write_register = AsyncMock(return_value=create_modbus_response())
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            await client.connect()
+
+            # Only one of the two registers is known - ask the device
+            await client.write_register(0x0100, 1)
+            assert await client.read_register(0x0100, count=2, max_age=60) == [1, 2]
+            mock_client.read_holding_registers.assert_called_once()
+
+            # Now both are - served locally
+            assert await client.read_register(0x0100, count=2, max_age=60) == [1, 2]
+            mock_client.read_holding_registers.assert_called_once()
+
+    async def test_read_block_short_response(self):
+        """Test block read rejects a response with fewer registers than requested."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+            mock_client.read_holding_registers = AsyncMock(
+                return_value=create_modbus_response([1, 0])
+            )
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            await client.connect()
+            result = await client.read_block(0x08A0, 3)
+
+            assert result is None
+
     async def test_read_register_single(self):
         """Test single register read convenience method."""
         with patch(
@@ -259,7 +530,6 @@ class TestAsyncModbusClientRead:
 class TestAsyncModbusClientWrite:
     """Test write operations."""
 
-    @pytest.mark.asyncio
     async def test_write_register_success(self):
         """Test successful register write."""
         with patch(
@@ -278,7 +548,6 @@ class TestAsyncModbusClientWrite:
             assert result is True
             mock_client.write_register.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_write_register_error_response(self):
         """Test register write with error response."""
         with patch(
@@ -299,7 +568,43 @@ class TestAsyncModbusClientWrite:
 
             assert result is False
 
-    @pytest.mark.asyncio
+    async def test_queued_writes_collapse_to_latest(self):
+        """Test writes queued behind an in-flight one collapse into the newest value."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+
+            async def slow_write(*args, **kwargs):
+                await asyncio.sleep(0.05)
+                return create_modbus_response()
+
+            mock_client.write_register = AsyncMock(side_effect=slow_write)
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            await client.connect()
+
+            first = asyncio.create_task(client.write_register(0x08A2, 1000))
+            await asyncio.sleep(0)  # let the first write reach the wire
+            results = await asyncio.gather(
+                first,
+                client.write_register(0x08A2, 2000),
+                client.write_register(0x08A2, 3000),
+                client.write_register(0x08A2, 3000),
+                return_exceptions=True,
+            )
+
+            # 2000 never reached the device, so its caller is told it was
+            # superseded; both callers asking for 3000 share the one write
+            assert results[0] is True
+            assert isinstance(results[1], WriteSupersededError)
+            assert results[2:] == [True, True]
+            written = [c.kwargs["value"] for c in mock_client.write_register.call_args_list]
+            assert written == [1000, 3000]
+
     async def test_write_register_32bit_success(self):
         """Test successful 32-bit register write."""
         with patch(
@@ -308,18 +613,21 @@ class TestAsyncModbusClientWrite:
             mock_client = AsyncMock()
             mock_client.connect = AsyncMock(return_value=True)
             mock_client.connected = True
-            mock_client.write_register = AsyncMock(return_value=create_modbus_response())
+            mock_client.write_registers = AsyncMock(return_value=create_modbus_response())
             mock_pymodbus.return_value = mock_client
 
             client = AsyncModbusClient("192.168.1.100")
             await client.connect()
-            result = await client.write_register_32bit(0x08A2, 5000)
+            result = await client.write_register_32bit(0x08A2, 70000)
 
             assert result is True
-            # Should write both high and low words
-            assert mock_client.write_register.call_count == 2
+            # Both words go out in a single FC16 request, high word first
+            mock_client.write_registers.assert_called_once()
+            call_kwargs = mock_client.write_registers.call_args.kwargs
+            assert call_kwargs["address"] == 0x08A2
+            assert call_kwargs["values"] == list(create_32bit_registers(70000))
+            mock_client.write_register.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_write_register_32bit_invalid_value(self):
         """Test 32-bit write with invalid value."""
         with patch(
@@ -341,9 +649,8 @@ class TestAsyncModbusClientWrite:
             result = await client.write_register_32bit(0x08A2, 0x100000000)
             assert result is False
 
-    @pytest.mark.asyncio
-    async def test_write_register_32bit_partial_failure_retry(self):
-        """Test 32-bit write retry on partial failure."""
+    async def test_write_register_32bit_failure_retry(self):
+        """Test 32-bit write retry on failure."""
         with patch(
             "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
         ) as mock_pymodbus:
@@ -352,28 +659,31 @@ class TestAsyncModbusClientWrite:
             mock_client.connected = True
             mock_client.close = MagicMock()
 
-            # First attempt fails completely, second succeeds
+            # First attempt fails, second succeeds
             call_results = [
-                create_modbus_response(),  # First high word succeeds
-                create_modbus_response(is_error=True),  # First low word fails
-                create_modbus_response(),  # Second high word succeeds
-                create_modbus_response(),  # Second low word succeeds
+                create_modbus_response(is_error=True),
+                create_modbus_response(),
             ]
-            mock_client.write_register = AsyncMock(side_effect=call_results)
+            mock_client.write_registers = AsyncMock(side_effect=call_results)
             mock_pymodbus.return_value = mock_client
 
             client = AsyncModbusClient("192.168.1.100")
             await client.connect()
-            result = await client.write_register_32bit(0x08A2, 5000, max_retries=2)
+            with patch(
+                "custom_components.bytewatt_export_limiter.modbus_client.asyncio.sleep",
+                new=AsyncMock(),
+            ) as mock_sleep:
+                result = await client.write_register_32bit(0x08A2, 5000, max_retries=2)
 
             assert result is True
-            assert mock_client.write_register.call_count == 4
+            assert mock_client.write_registers.call_count == 2
+            # Backed off once, before the retry
+            mock_sleep.assert_awaited_once_with(WRITE_RETRY_BASE_DELAY)
 
 
 class TestAsyncModbusClientConvenienceMethods:
     """Test convenience methods for specific registers."""
 
-    @pytest.mark.asyncio
     async def test_read_soc(self):
         """Test SOC reading with scale factor."""
         with patch(
@@ -393,7 +703,6 @@ class TestAsyncModbusClientConvenienceMethods:
 
             assert result == 85.0
 
-    @pytest.mark.asyncio
     async def test_read_voltage(self):
         """Test voltage reading with scale factor."""
         with patch(
@@ -413,7 +722,6 @@ class TestAsyncModbusClientConvenienceMethods:
 
             assert result == 52.0
 
-    @pytest.mark.asyncio
     async def test_read_current_positive(self):
         """Test positive current reading (discharge)."""
         with patch(
@@ -433,7 +741,6 @@ class TestAsyncModbusClientConvenienceMethods:
 
             assert result == 10.0
 
-    @pytest.mark.asyncio
     async def test_read_current_negative(self):
         """Test negative current reading (charge)."""
         with patch(
@@ -454,7 +761,57 @@ class TestAsyncModbusClientConvenienceMethods:
 
             assert result == -10.0
 
-    @pytest.mark.asyncio
+    async def test_read_battery_block(self):
+        """Test battery telemetry comes back from two requests, decoded."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+            mock_client.read_holding_registers = AsyncMock(
+                side_effect=[
+                    create_modbus_response([520, 65436, 850, 3]),
+                    create_modbus_response([65036]),  # -500 W
+                ]
+            )
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            await client.connect()
+            result = await client.read_battery_block()
+
+            assert result == BatteryReadings(
+                voltage=52.0, current=-10.0, soc=85.0, status=3, power=-500
+            )
+            assert type(result.power) is int
+            assert mock_client.read_holding_registers.call_count == 2
+            first_call = mock_client.read_holding_registers.call_args_list[0].kwargs
+            assert first_call["address"] == 0x0100
+            assert first_call["count"] == 4
+
+    async def test_read_config_block(self):
+        """Test the config registers are read and decoded in one request."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+            mock_client.read_holding_registers = AsyncMock(
+                return_value=create_modbus_response([50, *create_32bit_registers(70000), 0, 0, 2])
+            )
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            await client.connect()
+            result = await client.read_config_block()
+
+            assert result == ConfigReadings(
+                max_feed_grid_pct=50, pv_capacity_storage=70000, system_mode=2
+            )
+            mock_client.read_holding_registers.assert_called_once()
+
     async def test_write_max_feed_grid_pct_valid(self):
         """Test writing valid percentage."""
         with patch(
@@ -472,7 +829,6 @@ class TestAsyncModbusClientConvenienceMethods:
 
             assert result is True
 
-    @pytest.mark.asyncio
     async def test_write_max_feed_grid_pct_invalid(self):
         """Test writing invalid percentage."""
         with patch(
@@ -496,11 +852,10 @@ class TestAsyncModbusClientConvenienceMethods:
 
 
 class TestAsyncModbusClientThreadSafety:
-    """Test thread safety with lock."""
+    """Test concurrent use of one client."""
 
-    @pytest.mark.asyncio
     async def test_concurrent_reads(self):
-        """Test concurrent read operations are serialized."""
+        """Test unrelated reads are not serialized behind each other."""
         with patch(
             "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
         ) as mock_pymodbus:
@@ -528,5 +883,66 @@ class TestAsyncModbusClientThreadSafety:
                 client.read_register(0x0101),
             )
 
-            # Due to lock, operations should be serialized
-            assert call_order == ["start", "end", "start", "end"]
+            # The lock only guards connecting - both requests are on the wire at once
+            assert call_order == ["start", "start", "end", "end"]
+
+    async def test_concurrent_reads_reconnect_once(self):
+        """Test callers that find the connection down share a single reconnect."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connected = True
+
+            async def slow_connect():
+                await asyncio.sleep(0.05)
+                return True
+
+            mock_client.connect = AsyncMock(side_effect=slow_connect)
+            mock_client.read_holding_registers = AsyncMock(
+                return_value=create_modbus_response([1234])
+            )
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+
+            results = await asyncio.gather(
+                client.read_register(0x0100),
+                client.read_register(0x0101),
+                client.read_register(0x0102),
+            )
+
+            assert results == [[1234], [1234], [1234]]
+            mock_client.connect.assert_called_once()
+
+    async def test_identical_concurrent_reads_share_request(self):
+        """Test identical reads issued together go to the device once."""
+        with patch(
+            "custom_components.bytewatt_export_limiter.modbus_client.AsyncModbusTcpClient"
+        ) as mock_pymodbus:
+            mock_client = AsyncMock()
+            mock_client.connect = AsyncMock(return_value=True)
+            mock_client.connected = True
+
+            async def mock_read(*args, **kwargs):
+                await asyncio.sleep(0.05)
+                return create_modbus_response([1, 0, 5000])
+
+            mock_client.read_holding_registers = AsyncMock(side_effect=mock_read)
+            mock_pymodbus.return_value = mock_client
+
+            client = AsyncModbusClient("192.168.1.100")
+            await client.connect()
+
+            first, second = await asyncio.gather(
+                client.read_block(0x08A0, 3),
+                client.read_block(0x08A0, 3),
+            )
+
+            assert first == second == [1, 0, 5000]
+            assert first is not second
+            mock_client.read_holding_registers.assert_called_once()
+
+            # Once settled, the next read goes back to the device
+            await client.read_block(0x08A0, 3)
+            assert mock_client.read_holding_registers.call_count == 2
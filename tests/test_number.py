@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -9,25 +10,24 @@ import pytest
 from custom_components.bytewatt_export_limiter.const import DOMAIN
 from custom_components.bytewatt_export_limiter.number import BytewattManualLimitNumber
 
+from .conftest import create_coordinator_data
+
 
 @pytest.fixture
 def mock_coordinator():
-    """Create a mock coordinator."""
-    coordinator = MagicMock()
-    coordinator.data = {
-        "export_limit": 5000,
-        "our_limit": 5000,
-    }
-    coordinator.our_limit = 5000
-    coordinator.last_update_success = True
-    coordinator.set_export_limit = AsyncMock(return_value=True)
-    coordinator.device_info = {
-        "identifiers": {(DOMAIN, "test_entry")},
-        "name": "Bytewatt Export Limiter",
-        "manufacturer": "Bytewatt",
-        "model": "Export Limiter",
-    }
-    return coordinator
+    """Create a stand-in coordinator; only set_export_limit is call-tracked."""
+    return SimpleNamespace(
+        data=create_coordinator_data(export_limit=5000, our_limit=5000),
+        our_limit=5000,
+        last_update_success=True,
+        set_export_limit=AsyncMock(return_value=True),
+        device_info={
+            "identifiers": {(DOMAIN, "test_entry")},
+            "name": "Bytewatt Export Limiter",
+            "manufacturer": "Bytewatt",
+            "model": "Export Limiter",
+        },
+    )
 
 
 @pytest.fixture
@@ -57,13 +57,12 @@ class TestManualLimitNumber:
 
     def test_native_value_none_when_our_limit_not_set(self, mock_coordinator, mock_config_entry):
         """Test native value is None when our_limit is not set."""
-        mock_coordinator.data["our_limit"] = None
+        mock_coordinator.data = create_coordinator_data(our_limit=None)
 
         number = BytewattManualLimitNumber(mock_coordinator, mock_config_entry)
 
         assert number.native_value is None
 
-    @pytest.mark.asyncio
     async def test_set_native_value_success(self, mock_coordinator, mock_config_entry):
         """Test setting value successfully."""
         number = BytewattManualLimitNumber(mock_coordinator, mock_config_entry)
@@ -72,7 +71,6 @@ class TestManualLimitNumber:
 
         mock_coordinator.set_export_limit.assert_called_once_with(7500)
 
-    @pytest.mark.asyncio
     async def test_set_native_value_failure_raises(self, mock_coordinator, mock_config_entry):
         """Test setting value failure raises HomeAssistantError."""
         from homeassistant.exceptions import HomeAssistantError
@@ -94,7 +92,8 @@ class TestManualLimitNumber:
         """Test device info is from coordinator."""
         number = BytewattManualLimitNumber(mock_coordinator, mock_config_entry)
 
-        assert number.device_info == mock_coordinator.device_info
+        # The coordinator's dict is shared, not rebuilt per entity
+        assert number.device_info is mock_coordinator.device_info
 
     def test_native_min_value(self, mock_coordinator, mock_config_entry):
         """Test minimum value is 0."""
@@ -2,37 +2,40 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
 from custom_components.bytewatt_export_limiter.const import DOMAIN
-from custom_components.bytewatt_export_limiter.sensor import (
-    BytewattCurrentPriceSensor,
-    BytewattExportLimitSensor,
-    BytewattSAPNLimitSensor,
-)
+from custom_components.bytewatt_export_limiter.sensor import SENSORS, BytewattSensor
+
+from .conftest import create_coordinator_data
 
 
 @pytest.fixture
 def mock_coordinator():
-    """Create a mock coordinator."""
-    coordinator = MagicMock()
-    coordinator.data = {
-        "export_limit": 5000,
-        "their_limit": 10000,
-        "current_price": 0.10,
-        "is_curtailed": False,
-        "automation_enabled": False,
-    }
-    coordinator.last_update_success = True
-    coordinator.device_info = {
-        "identifiers": {(DOMAIN, "test_entry")},
-        "name": "Bytewatt Export Limiter",
-        "manufacturer": "Bytewatt",
-        "model": "Export Limiter",
-    }
-    return coordinator
+    """Create a stand-in coordinator (plain attributes - nothing is call-tracked)."""
+    return SimpleNamespace(
+        data=create_coordinator_data(
+            export_limit=5000,
+            their_limit=10000,
+            current_price=0.10,
+        ),
+        last_update_success=True,
+        device_info={
+            "identifiers": {(DOMAIN, "test_entry")},
+            "name": "Bytewatt Export Limiter",
+            "manufacturer": "Bytewatt",
+            "model": "Export Limiter",
+        },
+    )
+
+
+def _make_sensor(key, coordinator, entry):
+    """Build the sensor described by ``key``."""
+    description = next(d for d in SENSORS if d.key == key)
+    return BytewattSensor(coordinator, entry, description)
 
 
 @pytest.fixture
@@ -48,7 +51,7 @@ class TestExportLimitSensor:
 
     def test_native_value(self, mock_coordinator, mock_config_entry):
         """Test native value returns export limit."""
-        sensor = BytewattExportLimitSensor(mock_coordinator, mock_config_entry)
+        sensor = _make_sensor("export_limit", mock_coordinator, mock_config_entry)
 
         assert sensor.native_value == 5000
 
@@ -56,25 +59,26 @@ class TestExportLimitSensor:
         """Test native value is None when data is missing."""
         mock_coordinator.data = None
 
-        sensor = BytewattExportLimitSensor(mock_coordinator, mock_config_entry)
+        sensor = _make_sensor("export_limit", mock_coordinator, mock_config_entry)
 
         assert sensor.native_value is None
 
     def test_unique_id(self, mock_coordinator, mock_config_entry):
         """Test unique ID is correctly formatted."""
-        sensor = BytewattExportLimitSensor(mock_coordinator, mock_config_entry)
+        sensor = _make_sensor("export_limit", mock_coordinator, mock_config_entry)
 
         assert sensor.unique_id == "test_entry_export_limit"
 
     def test_device_info(self, mock_coordinator, mock_config_entry):
         """Test device info is from coordinator."""
-        sensor = BytewattExportLimitSensor(mock_coordinator, mock_config_entry)
+        sensor = _make_sensor("export_limit", mock_coordinator, mock_config_entry)
 
-        assert sensor.device_info == mock_coordinator.device_info
+        # The coordinator's dict is shared, not rebuilt per entity
+        assert sensor.device_info is mock_coordinator.device_info
 
     def test_native_unit_of_measurement(self, mock_coordinator, mock_config_entry):
         """Test unit of measurement is watts."""
-        sensor = BytewattExportLimitSensor(mock_coordinator, mock_config_entry)
+        sensor = _make_sensor("export_limit", mock_coordinator, mock_config_entry)
 
         assert sensor.native_unit_of_measurement == "W"
 
@@ -84,7 +88,7 @@ class TestSAPNLimitSensor:
 
     def test_native_value(self, mock_coordinator, mock_config_entry):
         """Test native value returns their_limit."""
-        sensor = BytewattSAPNLimitSensor(mock_coordinator, mock_config_entry)
+        sensor = _make_sensor("sapn_limit", mock_coordinator, mock_config_entry)
 
         assert sensor.native_value == 10000
 
@@ -92,19 +96,19 @@ class TestSAPNLimitSensor:
         """Test native value is None when data is missing."""
         mock_coordinator.data = None
 
-        sensor = BytewattSAPNLimitSensor(mock_coordinator, mock_config_entry)
+        sensor = _make_sensor("sapn_limit", mock_coordinator, mock_config_entry)
 
         assert sensor.native_value is None
 
     def test_unique_id(self, mock_coordinator, mock_config_entry):
         """Test unique ID is correctly formatted."""
-        sensor = BytewattSAPNLimitSensor(mock_coordinator, mock_config_entry)
+        sensor = _make_sensor("sapn_limit", mock_coordinator, mock_config_entry)
 
         assert sensor.unique_id == "test_entry_sapn_limit"
 
     def test_native_unit_of_measurement(self, mock_coordinator, mock_config_entry):
         """Test unit of measurement is watts."""
-        sensor = BytewattSAPNLimitSensor(mock_coordinator, mock_config_entry)
+        sensor = _make_sensor("sapn_limit", mock_coordinator, mock_config_entry)
 
         assert sensor.native_unit_of_measurement == "W"
 
@@ -114,7 +118,7 @@ class TestCurrentPriceSensor:
 
     def test_native_value(self, mock_coordinator, mock_config_entry):
         """Test native value returns current price."""
-        sensor = BytewattCurrentPriceSensor(mock_coordinator, mock_config_entry)
+        sensor = _make_sensor("current_price", mock_coordinator, mock_config_entry)
 
         assert sensor.native_value == 0.10
 
@@ -122,18 +126,28 @@ class TestCurrentPriceSensor:
         """Test native value is None when data is missing."""
         mock_coordinator.data = None
 
-        sensor = BytewattCurrentPriceSensor(mock_coordinator, mock_config_entry)
+        sensor = _make_sensor("current_price", mock_coordinator, mock_config_entry)
 
         assert sensor.native_value is None
 
     def test_unique_id(self, mock_coordinator, mock_config_entry):
         """Test unique ID is correctly formatted."""
-        sensor = BytewattCurrentPriceSensor(mock_coordinator, mock_config_entry)
+        sensor = _make_sensor("current_price", mock_coordinator, mock_config_entry)
 
         assert sensor.unique_id == "test_entry_current_price"
 
     def test_native_unit_of_measurement(self, mock_coordinator, mock_config_entry):
         """Test unit of measurement is $/kWh."""
-        sensor = BytewattCurrentPriceSensor(mock_coordinator, mock_config_entry)
+        sensor = _make_sensor("current_price", mock_coordinator, mock_config_entry)
 
         assert sensor.native_unit_of_measurement == "$/kWh"
+
+
+class TestSensorDescriptions:
+    """Test the sensor description table."""
+
+    def test_keys_are_unique(self):
+        """Test every sensor has its own key (and so its own unique ID)."""
+        keys = [description.key for description in SENSORS]
+
+        assert keys == ["export_limit", "sapn_limit", "current_price"]
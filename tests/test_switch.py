@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -9,24 +10,24 @@ import pytest
 from custom_components.bytewatt_export_limiter.const import DOMAIN
 from custom_components.bytewatt_export_limiter.switch import BytewattAutomationSwitch
 
+from .conftest import create_coordinator_data
+
 
 @pytest.fixture
 def mock_coordinator():
-    """Create a mock coordinator."""
-    coordinator = MagicMock()
-    coordinator.data = {
-        "automation_enabled": False,
-    }
-    coordinator.automation_enabled = False
-    coordinator.last_update_success = True
-    coordinator.set_automation_enabled = AsyncMock()
-    coordinator.device_info = {
-        "identifiers": {(DOMAIN, "test_entry")},
-        "name": "Bytewatt Export Limiter",
-        "manufacturer": "Bytewatt",
-        "model": "Export Limiter",
-    }
-    return coordinator
+    """Create a stand-in coordinator; only set_automation_enabled is call-tracked."""
+    return SimpleNamespace(
+        data=create_coordinator_data(automation_enabled=False),
+        automation_enabled=False,
+        last_update_success=True,
+        set_automation_enabled=AsyncMock(),
+        device_info={
+            "identifiers": {(DOMAIN, "test_entry")},
+            "name": "Bytewatt Export Limiter",
+            "manufacturer": "Bytewatt",
+            "model": "Export Limiter",
+        },
+    )
 
 
 @pytest.fixture
@@ -42,7 +43,7 @@ class TestAutomationSwitch:
 
     def test_is_on_false(self, mock_coordinator, mock_config_entry):
         """Test is_on returns False when automation is disabled."""
-        mock_coordinator.data["automation_enabled"] = False
+        mock_coordinator.data = create_coordinator_data(automation_enabled=False)
 
         switch = BytewattAutomationSwitch(mock_coordinator, mock_config_entry)
 
@@ -50,7 +51,7 @@ class TestAutomationSwitch:
 
     def test_is_on_true(self, mock_coordinator, mock_config_entry):
         """Test is_on returns True when automation is enabled."""
-        mock_coordinator.data["automation_enabled"] = True
+        mock_coordinator.data = create_coordinator_data(automation_enabled=True)
 
         switch = BytewattAutomationSwitch(mock_coordinator, mock_config_entry)
 
@@ -64,24 +65,79 @@ class TestAutomationSwitch:
 
         assert switch.is_on is None
 
-    @pytest.mark.asyncio
+    def test_is_on_follows_coordinator_updates(self, mock_coordinator, mock_config_entry):
+        """Test the cached state is refreshed when the coordinator pushes data."""
+        switch = BytewattAutomationSwitch(mock_coordinator, mock_config_entry)
+        switch.async_write_ha_state = MagicMock()
+
+        mock_coordinator.data = create_coordinator_data(automation_enabled=True)
+        switch._handle_coordinator_update()
+
+        assert switch.is_on is True
+        switch.async_write_ha_state.assert_called_once()
+
+    def test_unchanged_state_not_rewritten(self, mock_coordinator, mock_config_entry):
+        """Test updates that don't touch the switch skip the state write."""
+        switch = BytewattAutomationSwitch(mock_coordinator, mock_config_entry)
+        switch.async_write_ha_state = MagicMock()
+
+        # Only the price changed
+        mock_coordinator.data = create_coordinator_data(automation_enabled=False, current_price=0.5)
+        switch._handle_coordinator_update()
+        switch.async_write_ha_state.assert_not_called()
+
+        # A failed poll changes availability and must still be written
+        mock_coordinator.last_update_success = False
+        switch._handle_coordinator_update()
+        switch.async_write_ha_state.assert_called_once()
+        assert switch.available is False
+
     async def test_turn_on(self, mock_coordinator, mock_config_entry):
         """Test turning on automation."""
         switch = BytewattAutomationSwitch(mock_coordinator, mock_config_entry)
+        switch.async_write_ha_state = MagicMock()
 
         await switch.async_turn_on()
 
         mock_coordinator.set_automation_enabled.assert_called_once_with(True)
 
-    @pytest.mark.asyncio
     async def test_turn_off(self, mock_coordinator, mock_config_entry):
         """Test turning off automation."""
         switch = BytewattAutomationSwitch(mock_coordinator, mock_config_entry)
+        switch.async_write_ha_state = MagicMock()
 
         await switch.async_turn_off()
 
         mock_coordinator.set_automation_enabled.assert_called_once_with(False)
 
+    async def test_turn_on_shows_state_before_write(self, mock_coordinator, mock_config_entry):
+        """Test the switch shows on before the coordinator call completes."""
+        switch = BytewattAutomationSwitch(mock_coordinator, mock_config_entry)
+        switch.async_write_ha_state = MagicMock()
+        seen = []
+        mock_coordinator.set_automation_enabled.side_effect = lambda _: seen.append(
+            (switch.is_on, switch.async_write_ha_state.call_count)
+        )
+
+        await switch.async_turn_on()
+
+        assert seen == [(True, 1)]
+        assert switch.is_on is True
+
+    async def test_turn_on_failure_reverts_state(self, mock_coordinator, mock_config_entry):
+        """Test a failed change puts the previous state back and raises."""
+        from homeassistant.exceptions import HomeAssistantError
+
+        switch = BytewattAutomationSwitch(mock_coordinator, mock_config_entry)
+        switch.async_write_ha_state = MagicMock()
+        mock_coordinator.set_automation_enabled.side_effect = Exception("boom")
+
+        with pytest.raises(HomeAssistantError):
+            await switch.async_turn_on()
+
+        assert switch.is_on is False
+        assert switch.async_write_ha_state.call_count == 2
+
     def test_unique_id(self, mock_coordinator, mock_config_entry):
         """Test unique ID is correctly formatted."""
         switch = BytewattAutomationSwitch(mock_coordinator, mock_config_entry)
@@ -92,4 +148,5 @@ class TestAutomationSwitch:
         """Test device info is from coordinator."""
         switch = BytewattAutomationSwitch(mock_coordinator, mock_config_entry)
 
-        assert switch.device_info == mock_coordinator.device_info
+        # The coordinator's dict is shared, not rebuilt per entity
+        assert switch.device_info is mock_coordinator.device_info